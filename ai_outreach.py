@@ -4,6 +4,7 @@ AI Outreach Service - Generate personalized emails and handle negotiations using
 import os
 import json
 import re
+from functools import lru_cache
 from typing import Dict, List, Optional
 from datetime import datetime
 import anthropic
@@ -105,10 +106,16 @@ OUTPUT FORMAT (JSON only, no markdown):
         return result
         
     except Exception as e:
-        # Fallback template
-        return {
-            "subject": f"Collaboration Opportunity for {channel_title}",
-            "body": f"""Hi {creator_name or 'there'},
+        return _fallback_outreach_email(creator_name, channel_title, campaign_brief,
+                                        budget_min, budget_max, sender_name)
+
+
+def _fallback_outreach_email(creator_name: str, channel_title: str, campaign_brief: str,
+                             budget_min: float, budget_max: float, sender_name: str) -> Dict:
+    """Template outreach email used when the AI is unavailable."""
+    return {
+        "subject": f"Collaboration Opportunity for {channel_title}",
+        "body": f"""Hi {creator_name or 'there'},
 
 I came across your channel {channel_title} and was impressed by your content. We're reaching out about a potential collaboration opportunity.
 
@@ -125,7 +132,213 @@ Would love to hear from you!
 
 Best regards,
 {sender_name}"""
-        }
+    }
+
+
+def generate_outreach_emails_batch(
+    creators: List[Dict],
+    campaign_brief: str,
+    budget_min: float,
+    budget_max: float,
+    topic: str,
+    requirements: str = "",
+    deadline: str = "",
+    sender_name: str = "Marketing Team"
+) -> List[Dict]:
+    """
+    Generate personalized outreach emails for several creators in one AI request.
+    
+    Args:
+        creators: Dicts with 'creator_name', 'channel_title', 'subscribers', 'content_focus'
+    
+    Returns:
+        List of dicts with 'subject' and 'body' keys, in the same order as creators
+    """
+    client = get_client()
+    
+    creators_text = "\n".join(
+        f"{i}. Channel Name: {c['channel_title']} | Subscribers: {c['subscribers']:,} | "
+        f"Content Focus: {c['content_focus']}"
+        for i, c in enumerate(creators, 1)
+    )
+    
+    prompt = f"""You are an expert influencer marketing specialist. Write a professional, personalized outreach email to EACH of the following YouTube creators for a brand collaboration.
+
+CREATORS:
+{creators_text}
+
+CAMPAIGN DETAILS:
+- Brief: {campaign_brief}
+- Topic: {topic}
+- Budget Range: ${budget_min:,.0f} - ${budget_max:,.0f}
+- Requirements: {requirements if requirements else "Flexible based on creator's style"}
+- Deadline: {deadline if deadline else "Flexible"}
+
+SENDER: {sender_name}
+
+INSTRUCTIONS:
+1. Write a warm, professional email for each creator that feels personal (not template-y)
+2. Reference their specific content/channel to show you've done research
+3. Clearly explain the opportunity without being pushy
+4. Mention the budget range to show you're serious
+5. IMPORTANT: End with a request for them to share:
+   - Their budget expectations/rate
+   - Channel analytics snapshot (impressions, engagement rate)
+   - Typical reach per video
+6. Include a clear call-to-action asking them to reply with this info
+7. Keep each one concise (under 200 words for the body)
+
+MUST INCLUDE this type of closing:
+"To help us tailor this opportunity, could you share your rate, a quick analytics snapshot, and your typical video reach? Looking forward to hearing from you!"
+
+OUTPUT FORMAT (JSON array only, no markdown, one object per creator in the order listed):
+[
+    {{"subject": "Email subject line here", "body": "Email body here"}}
+]
+"""
+
+    try:
+        if not client:
+            raise ValueError("AI client not available")
+        
+        message = client.messages.create(
+            model="claude-sonnet-4-5-20250929",
+            max_tokens=min(600 * len(creators), 8192),
+            messages=[{"role": "user", "content": prompt}]
+        )
+        
+        response_text = message.content[0].text
+        response_text = re.sub(r'```json\n?', '', response_text)
+        response_text = re.sub(r'```\n?', '', response_text)
+        
+        results = json.loads(response_text.strip())
+        if (not isinstance(results, list) or len(results) != len(creators)
+                or not all(isinstance(r, dict) and "subject" in r and "body" in r for r in results)):
+            raise ValueError("AI returned an unexpected batch of emails")
+        return results
+    
+    except Exception as e:
+        print(f"ERROR generating outreach email batch, using fallback: {e}")
+        return [
+            _fallback_outreach_email(c['creator_name'], c['channel_title'], campaign_brief,
+                                     budget_min, budget_max, sender_name)
+            for c in creators
+        ]
+
+
+# Mail-merge fields an outreach template may contain, e.g. {{creator_name}}
+_PLACEHOLDER_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+def generate_outreach_template(
+    campaign_brief: str,
+    budget_min: float,
+    budget_max: float,
+    topic: str,
+    requirements: str = "",
+    deadline: str = "",
+    sender_name: str = "Marketing Team"
+) -> Dict:
+    """
+    Generate one outreach email template for a whole campaign.
+    The template uses {{creator_name}}, {{channel_title}} and {{subscribers}}
+    placeholders - fill them per contact with render_outreach_template.
+    
+    Returns:
+        Dict with 'subject' and 'body' keys
+    """
+    try:
+        return dict(_generate_outreach_template_cached(
+            campaign_brief, budget_min, budget_max, topic, requirements, deadline, sender_name
+        ))
+    except Exception as e:
+        print(f"ERROR generating outreach template, using fallback: {e}")
+        return _fallback_outreach_email("{{creator_name}}", "{{channel_title}}", campaign_brief,
+                                        budget_min, budget_max, sender_name)
+
+
+@lru_cache(maxsize=128)
+def _generate_outreach_template_cached(campaign_brief: str, budget_min: float, budget_max: float,
+                                       topic: str, requirements: str, deadline: str,
+                                       sender_name: str) -> Dict:
+    """Ask the AI for a campaign template (memoized; failures raise and are not cached)."""
+    client = get_client()
+    if not client:
+        raise ValueError("AI client not available")
+    
+    prompt = f"""You are an expert influencer marketing specialist. Write a professional outreach email TEMPLATE that will be sent to many YouTube creators for a brand collaboration.
+
+CAMPAIGN DETAILS:
+- Brief: {campaign_brief}
+- Topic: {topic}
+- Budget Range: ${budget_min:,.0f} - ${budget_max:,.0f}
+- Requirements: {requirements if requirements else "Flexible based on creator's style"}
+- Deadline: {deadline if deadline else "Flexible"}
+
+SENDER: {sender_name}
+
+PLACEHOLDERS (use these exactly, they are filled in for each creator):
+- {{{{creator_name}}}} - the creator's name
+- {{{{channel_title}}}} - their channel name
+- {{{{subscribers}}}} - their subscriber count
+
+INSTRUCTIONS:
+1. Write a warm, professional email that feels personal (not template-y)
+2. Use the placeholders to reference the creator and their channel
+3. Clearly explain the opportunity without being pushy
+4. Mention the budget range to show you're serious
+5. IMPORTANT: End with a request for them to share:
+   - Their budget expectations/rate
+   - Channel analytics snapshot (impressions, engagement rate)
+   - Typical reach per video
+6. Include a clear call-to-action asking them to reply with this info
+7. Keep it concise (under 200 words for the body)
+8. Do not use any other {{{{...}}}} placeholders
+
+MUST INCLUDE this type of closing:
+"To help us tailor this opportunity, could you share your rate, a quick analytics snapshot, and your typical video reach? Looking forward to hearing from you!"
+
+OUTPUT FORMAT (JSON only, no markdown):
+{{
+    "subject": "Email subject line here",
+    "body": "Email body here"
+}}
+"""
+    
+    message = client.messages.create(
+        model="claude-sonnet-4-5-20250929",
+        max_tokens=1024,
+        messages=[{"role": "user", "content": prompt}]
+    )
+    
+    response_text = message.content[0].text
+    response_text = re.sub(r'```json\n?', '', response_text)
+    response_text = re.sub(r'```\n?', '', response_text)
+    
+    result = json.loads(response_text.strip())
+    if not isinstance(result, dict) or "subject" not in result or "body" not in result:
+        raise ValueError("AI returned an unexpected template")
+    return {"subject": result["subject"], "body": result["body"]}
+
+
+def clear_outreach_template_cache():
+    """Drop memoized campaign templates, e.g. after a campaign is edited."""
+    _generate_outreach_template_cached.cache_clear()
+
+
+def render_outreach_template(template: Dict, creator_name: str, channel_title: str,
+                             subscribers: int = 0) -> Dict:
+    """Fill a template's placeholders for one creator; unknown placeholders are dropped."""
+    values = {
+        "creator_name": creator_name or "there",
+        "channel_title": channel_title or creator_name or "",
+        "subscribers": f"{subscribers or 0:,}",
+    }
+    
+    def fill(text: str) -> str:
+        return _PLACEHOLDER_RE.sub(lambda m: values.get(m.group(1), ""), text)
+    
+    return {"subject": fill(template["subject"]), "body": fill(template["body"])}
 
 
 def generate_negotiation_response(
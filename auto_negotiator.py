@@ -222,11 +222,12 @@ def decode_subject(subject) -> str:
     return result
 
 
-def get_body_hash(body: str) -> str:
+def get_body_hash(body: str) -> bytes:
     """Create a hash of the email body for duplicate detection."""
     # Normalize: lowercase, remove extra whitespace
     normalized = ' '.join(body.lower().split())
-    return hashlib.md5(normalized.encode()).hexdigest()
+    # First 64 bits of sha256 - compact BLOB key for the processed_emails index
+    return hashlib.sha256(normalized.encode()).digest()[:8]
 
 
 # ============================================================
@@ -235,8 +236,8 @@ def get_body_hash(body: str) -> str:
 
 def find_matching_outreach(from_email: str, subject: str) -> Optional[Dict]:
     """Find the outreach email this is a reply to."""
-    outreach_list = db.get_outreach_emails(status='sent')
-    replied_list = db.get_outreach_emails(status='replied')
+    outreach_list = db.get_outreach_emails(status='sent', include_channel=False)
+    replied_list = db.get_outreach_emails(status='replied', include_channel=False)
     outreach_list.extend(replied_list)
     
     # Clean the from email
@@ -699,9 +700,8 @@ def should_send_followup(outreach: Dict) -> bool:
     if followup_count >= 2:
         return False
     
-    # Check time since last outbound
-    thread_stats = db.get_thread_stats(outreach['id'])
-    last_outbound = thread_stats.get('last_outbound')
+    # Check time since last outbound (kept on the outreach row by trigger)
+    last_outbound = outreach.get('last_outbound_at')
     
     if not last_outbound:
         return False
@@ -807,6 +807,9 @@ def check_inbox_for_replies(account: Dict) -> List[Dict]:
         return results
     
     try:
+        # Pick up emails processed by other workers since the last poll
+        db.sync_processed_filter()
+        
         mail.select('INBOX')
         
         # Search for emails from last 7 days (wider window to catch missed ones)
@@ -822,6 +825,9 @@ def check_inbox_for_replies(account: Dict) -> List[Dict]:
         
         print(f"  Found {len(all_nums)} emails to check")
         
+        # Skipped messages are marked processed in one batch after the loop
+        skipped_rows = []
+        
         for num in all_nums:
             if not num:
                 continue
@@ -856,7 +862,7 @@ def check_inbox_for_replies(account: Dict) -> List[Dict]:
                     # CRITICAL: Check terminal state BEFORE processing
                     if is_terminal_state(outreach):
                         print(f"    Skipping {from_email} - deal already {outreach.get('negotiation_stage')}")
-                        db.mark_email_processed(message_id, from_email, subject, body_hash)
+                        skipped_rows.append((message_id, from_email, subject, body_hash))
                         skipped_count += 1
                         continue
                     
@@ -873,6 +879,7 @@ def check_inbox_for_replies(account: Dict) -> List[Dict]:
                 print(f"    Error processing email {num}: {e}")
                 continue
         
+        db.mark_emails_processed(skipped_rows)
         mail.logout()
         print(f"  Inbox check complete: {processed_count} processed, {skipped_count} skipped")
         
@@ -887,8 +894,8 @@ def get_pending_outreach() -> List[Dict]:
     all_outreach = []
     
     # Get sent and replied outreach
-    sent = db.get_outreach_emails(status='sent')
-    replied = db.get_outreach_emails(status='replied')
+    sent = db.get_outreach_emails(status='sent', include_channel=False)
+    replied = db.get_outreach_emails(status='replied', include_channel=False)
     
     for o in sent + replied:
         if not is_terminal_state(o):
@@ -2,10 +2,17 @@
 SQLite Database Module for YouTube Channel Scraper
 """
 import sqlite3
+import hashlib
 import json
+import math
 import os
+import re
+import threading
+import time
+from functools import lru_cache, wraps
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 from contextlib import contextmanager
 
 # Use /data directory for Render persistent disk, fallback to local
@@ -20,23 +27,230 @@ except:
 DATABASE_PATH = os.path.join(DATA_DIR, "youtube_channels.db")
 print(f"Database path: {DATABASE_PATH}")
 
+# Bump whenever the schema or MIGRATION_COLUMNS change so existing
+# databases get migrated on the next startup.
+SCHEMA_VERSION = 8
+
+# Columns added after the first release: (table, column, type, default)
+MIGRATION_COLUMNS = [
+    ('campaigns', 'max_offer', 'REAL', 500),
+    ('campaigns', 'offer_increment', 'REAL', 50),
+    ('outreach_emails', 'current_offer', 'REAL', 0),
+    ('outreach_emails', 'negotiation_rounds', 'INTEGER', 0),
+    ('outreach_emails', 'followup_count', 'INTEGER', 0),
+    ('outreach_emails', 'last_followup_at', 'TIMESTAMP', None),
+    ('outreach_emails', 'last_inbound_at', 'TIMESTAMP', None),
+    ('outreach_emails', 'inbound_count', 'INTEGER', 0),
+    ('outreach_emails', 'outbound_count', 'INTEGER', 0),
+    ('outreach_emails', 'last_outbound_at', 'TIMESTAMP', None),
+]
+
+# Creator-focused search queries - targeting INDIVIDUALS not brands.
+# Seeded into search_query_defaults during schema setup.
+CREATOR_FOCUSED_QUERIES = [
+    # ===== PERSONAL JOURNEY STORIES =====
+    ("how I made my first $10k online", 30, "US"),
+    ("my journey to 100k subscribers", 25, "US"),
+    ("I quit my 9 to 5 job", 25, "US"),
+    ("my first year as entrepreneur", 25, "US"),
+    ("how I started my online business from scratch", 25, "US"),
+
+    # ===== INCOME/RESULTS REPORTS =====
+    ("income report youtuber", 25, "US"),
+    ("how much I made this month", 25, "US"),
+    ("revealing my earnings", 25, "US"),
+    ("my affiliate marketing income", 25, "US"),
+    ("dropshipping income proof", 25, "US"),
+
+    # ===== PERSONAL ADS/MARKETING CONTENT =====
+    ("I spent $1000 on facebook ads", 25, "US"),
+    ("my facebook ads results", 25, "US"),
+    ("testing tiktok ads for my store", 25, "US"),
+    ("my meta ads strategy", 25, "US"),
+    ("I tried google ads for 30 days", 25, "US"),
+
+    # ===== ECOMMERCE CREATOR STORIES =====
+    ("my shopify store journey", 25, "US"),
+    ("I started dropshipping with $0", 25, "US"),
+    ("my etsy shop income", 25, "US"),
+    ("amazon fba beginner journey", 25, "US"),
+    ("print on demand real results", 25, "US"),
+
+    # ===== SIDE HUSTLE/ENTREPRENEUR =====
+    ("best side hustles I actually tried", 25, "US"),
+    ("how I make passive income", 25, "US"),
+    ("day in my life online entrepreneur", 25, "US"),
+    ("work from home business ideas that work", 25, "US"),
+    ("my online business income streams", 25, "US"),
+
+    # ===== YOUTUBE/CONTENT CREATOR GROWTH =====
+    ("how I grew my youtube channel", 25, "US"),
+    ("my content creation journey", 25, "US"),
+    ("youtube monetization tips from experience", 25, "US"),
+    ("growing on social media as beginner", 25, "US"),
+
+    # ===== NICHE SPECIFIC CREATORS =====
+    ("real estate agent marketing tips", 25, "US"),
+    ("fitness influencer income", 25, "US"),
+    ("travel youtuber behind the scenes", 25, "US"),
+    ("food blogger income report", 25, "US"),
+]
+
+# Fixed SQL for hot single-row lookups - identical text keeps sqlite3's statement cache warm
+_SQL_GET_OUTREACH = """
+    SELECT o.*, c.channel_title, c.subscribers, c.thumbnail_url
+    FROM outreach_emails o
+    LEFT JOIN channels c ON o.channel_id = c.channel_id
+    WHERE o.id = ?
+"""
+_SQL_GET_EMAIL_THREAD = """
+    SELECT * FROM email_threads 
+    WHERE outreach_id = ? 
+    ORDER BY sent_at ASC, id ASC
+"""
+_SQL_GET_EMAIL_THREAD_PAGE = """
+    SELECT * FROM email_threads 
+    WHERE outreach_id = ? 
+      AND (sent_at, id) > (SELECT sent_at, id FROM email_threads WHERE id = ?)
+    ORDER BY sent_at ASC, id ASC
+    LIMIT ?
+"""
+_SQL_PROCESSED_BY_MESSAGE_ID = "SELECT 1 FROM processed_emails WHERE message_id = ? LIMIT 1"
+_SQL_PROCESSED_BY_BODY_HASH = "SELECT 1 FROM processed_emails WHERE body_hash = ? LIMIT 1"
+_SQL_PROCESSED_BY_EITHER = "SELECT 1 FROM processed_emails WHERE message_id = ? OR body_hash = ? LIMIT 1"
+
+# Columns the generic update_* helpers are allowed to set
+_UPDATABLE_COLUMNS = {
+    'email_accounts': frozenset({
+        'email', 'smtp_host', 'smtp_port', 'smtp_user', 'smtp_password',
+        'display_name', 'is_active', 'last_used', 'emails_sent_today', 'daily_limit',
+    }),
+    'outreach_emails': frozenset({
+        'campaign_id', 'channel_id', 'email_account_id', 'recipient_email', 'subject',
+        'body', 'status', 'sent_at', 'opened_at', 'replied_at', 'reply_content',
+        'ai_response', 'negotiation_stage', 'current_offer', 'negotiation_rounds',
+        'followup_count', 'last_followup_at', 'last_inbound_at',
+    }),
+    'mailing_list': frozenset({
+        'name', 'email', 'channel_id', 'channel_title', 'subscribers', 'notes',
+        'status', 'campaign_id', 'outreach_id',
+    }),
+    'campaigns': frozenset({
+        'name', 'brief', 'budget_min', 'budget_max', 'max_offer', 'offer_increment',
+        'topic', 'requirements', 'deadline', 'status', 'updated_at',
+    }),
+}
+
+
+@lru_cache(maxsize=64)
+def _build_update_sql(table: str, columns: tuple) -> str:
+    """Build (and cache) an UPDATE ... WHERE id = ? statement for a set of columns."""
+    unknown = set(columns) - _UPDATABLE_COLUMNS[table]
+    if unknown:
+        raise ValueError(f"Cannot update {table} column(s): {', '.join(sorted(unknown))}")
+    updates = ", ".join(f"{column} = ?" for column in columns)
+    return f"UPDATE {table} SET {updates} WHERE id = ?"
+
+
+# One long-lived connection per thread, reused by every get_db() call
+_local = threading.local()
+
+
+def _connect(check_same_thread: bool = True) -> sqlite3.Connection:
+    """Open a tuned connection to the database."""
+    conn = sqlite3.connect(DATABASE_PATH, cached_statements=256,
+                           check_same_thread=check_same_thread)
+    conn.row_factory = sqlite3.Row
+    # Per-connection settings; journal_mode=WAL is persistent and set once in init_db().
+    # NORMAL sync is safe under WAL and skips the per-commit fsync.
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
 
 @contextmanager
 def get_db():
-    """Context manager for database connections."""
-    conn = sqlite3.connect(DATABASE_PATH)
-    conn.row_factory = sqlite3.Row
+    """Context manager yielding this thread's database connection."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _local.conn = _connect()
+        _local.depth = 0
+    
+    _local.depth += 1
     try:
         yield conn
     finally:
-        conn.close()
+        _local.depth -= 1
+        # Discard anything the caller left uncommitted (as closing used to)
+        if _local.depth == 0 and conn.in_transaction:
+            conn.rollback()
+
+
+def _fetch_dicts(cursor, batch_size: int = 0) -> List[Dict]:
+    """Fetch all remaining rows as dicts, reading the column names only once."""
+    columns = [col[0] for col in cursor.description]
+    if not batch_size:
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    
+    results = []
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        results.extend(dict(zip(columns, row)) for row in rows)
+    return results
+
+
+# Bumped by every write that can change a cached read; see _ttl_cache
+_cache_version = 0
+
+
+def _invalidate_cache():
+    """Mark all _ttl_cache results as stale."""
+    global _cache_version
+    _cache_version += 1
+
+
+def _ttl_cache(ttl: float):
+    """Memoize a read for up to ttl seconds, or until _invalidate_cache() is called."""
+    def decorator(func):
+        entries = {}
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            entry = entries.get(key)
+            if entry and entry[1] == _cache_version and time.monotonic() - entry[0] < ttl:
+                return entry[2]
+            version = _cache_version
+            value = func(*args, **kwargs)
+            entries[key] = (time.monotonic(), version, value)
+            return value
+        
+        return wrapper
+    return decorator
 
 
 def init_db():
     """Initialize the database with required tables."""
     with get_db() as conn:
         cursor = conn.cursor()
-        
+
+        # WAL lets readers run alongside a writer. The mode is stored in the
+        # database file, so this only has to run once per startup.
+        cursor.execute("PRAGMA journal_mode=WAL")
+
+        # Schema is already up to date - nothing to do on this startup
+        cursor.execute("PRAGMA user_version")
+        if cursor.fetchone()[0] >= SCHEMA_VERSION:
+            return
+
+        # Run all schema setup in a single transaction
+        cursor.execute("BEGIN")
+
         # Channels table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS channels (
@@ -69,6 +283,21 @@ def init_db():
             )
         """)
         
+        # Defaults used by reset_search_queries_to_creator_focused()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS search_query_defaults (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                query TEXT NOT NULL,
+                max_results INTEGER DEFAULT 25,
+                region_code TEXT DEFAULT 'US'
+            )
+        """)
+        cursor.execute("DELETE FROM search_query_defaults")
+        cursor.executemany(
+            "INSERT INTO search_query_defaults (query, max_results, region_code) VALUES (?, ?, ?)",
+            CREATOR_FOCUSED_QUERIES
+        )
+        
         # Scrape history table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS scrape_history (
@@ -81,14 +310,72 @@ def init_db():
                 error_message TEXT
             )
         """)
-        
-        conn.commit()
-    
-    # Initialize email tables
-    init_email_tables()
-    
-    with get_db() as conn:
-        cursor = conn.cursor()
+
+        # Full-text index over channel title/description, kept in sync by triggers
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS channels_fts USING fts5(
+                channel_title,
+                description,
+                content='channels',
+                content_rowid='id',
+                tokenize = "unicode61 remove_diacritics 2"
+            )
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS channels_fts_ai AFTER INSERT ON channels BEGIN
+                INSERT INTO channels_fts (rowid, channel_title, description)
+                VALUES (new.id, new.channel_title, new.description);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS channels_fts_ad AFTER DELETE ON channels BEGIN
+                INSERT INTO channels_fts (channels_fts, rowid, channel_title, description)
+                VALUES ('delete', old.id, old.channel_title, old.description);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS channels_fts_au AFTER UPDATE OF channel_title, description ON channels BEGIN
+                INSERT INTO channels_fts (channels_fts, rowid, channel_title, description)
+                VALUES ('delete', old.id, old.channel_title, old.description);
+                INSERT INTO channels_fts (rowid, channel_title, description)
+                VALUES (new.id, new.channel_title, new.description);
+            END
+        """)
+        # Index any channels that existed before the FTS table
+        cursor.execute("INSERT INTO channels_fts (channels_fts) VALUES ('rebuild')")
+
+        # Email tables and column migrations
+        init_email_tables(conn)
+        migrate_database(conn)
+
+        # Keep per-thread counters on outreach_emails current as messages are added
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS email_threads_counts_ai AFTER INSERT ON email_threads BEGIN
+                UPDATE outreach_emails SET
+                    inbound_count = inbound_count + (new.direction = 'inbound'),
+                    outbound_count = outbound_count + (new.direction = 'outbound'),
+                    last_inbound_at = CASE WHEN new.direction = 'inbound'
+                                           THEN new.sent_at ELSE last_inbound_at END,
+                    last_outbound_at = CASE WHEN new.direction = 'outbound'
+                                            THEN new.sent_at ELSE last_outbound_at END
+                WHERE id = new.outreach_id;
+            END
+        """)
+        # Backfill the counters from existing threads
+        cursor.execute("""
+            UPDATE outreach_emails SET
+                inbound_count = (SELECT COUNT(*) FROM email_threads t
+                                 WHERE t.outreach_id = outreach_emails.id AND t.direction = 'inbound'),
+                outbound_count = (SELECT COUNT(*) FROM email_threads t
+                                  WHERE t.outreach_id = outreach_emails.id AND t.direction = 'outbound'),
+                last_inbound_at = COALESCE(
+                    (SELECT MAX(sent_at) FROM email_threads t
+                     WHERE t.outreach_id = outreach_emails.id AND t.direction = 'inbound'),
+                    last_inbound_at),
+                last_outbound_at = (SELECT MAX(sent_at) FROM email_threads t
+                                    WHERE t.outreach_id = outreach_emails.id AND t.direction = 'outbound')
+        """)
+
         # Insert default search queries if empty
         cursor.execute("SELECT COUNT(*) FROM search_queries")
         if cursor.fetchone()[0] == 0:
@@ -114,10 +401,57 @@ def init_db():
                 "INSERT INTO search_queries (query, max_results, region_code) VALUES (?, ?, ?)",
                 default_queries
             )
-        
+
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         conn.commit()
 
 
+def _fts_query(search: str) -> str:
+    """Turn free-text search into an FTS5 query of quoted prefix terms."""
+    terms = re.findall(r"\w+", search)
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def _search_condition(search: str):
+    """Build the WHERE fragment and params for a channel text search."""
+    fts_query = _fts_query(search)
+    if fts_query:
+        return "id IN (SELECT rowid FROM channels_fts WHERE channels_fts MATCH ?)", [fts_query]
+    # Nothing tokenizable (e.g. only punctuation) - fall back to a substring scan
+    return "(channel_title LIKE ? OR description LIKE ?)", [f"%{search}%", f"%{search}%"]
+
+
+def _channel_filters(search: str, country: str, language: str,
+                     min_subs: int, max_subs: int) -> Tuple[str, list]:
+    """Build the WHERE clause and params shared by the channel list queries."""
+    conditions = []
+    params = []
+    
+    if search:
+        search_sql, search_params = _search_condition(search)
+        conditions.append(search_sql)
+        params.extend(search_params)
+    
+    if country:
+        conditions.append("country = ?")
+        params.append(country)
+    
+    if language:
+        conditions.append("detected_language = ?")
+        params.append(language)
+    
+    if min_subs > 0:
+        conditions.append("subscribers >= ?")
+        params.append(min_subs)
+    
+    if max_subs > 0:
+        conditions.append("subscribers <= ?")
+        params.append(max_subs)
+    
+    where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
+    return where_clause, params
+
+
 def get_all_channels(limit: int = 100, offset: int = 0, search: str = "", 
                      country: str = "", language: str = "", 
                      min_subs: int = 0, max_subs: int = 0) -> List[Dict]:
@@ -125,30 +459,7 @@ def get_all_channels(limit: int = 100, offset: int = 0, search: str = "",
     with get_db() as conn:
         cursor = conn.cursor()
         
-        conditions = []
-        params = []
-        
-        if search:
-            conditions.append("(channel_title LIKE ? OR description LIKE ?)")
-            params.extend([f"%{search}%", f"%{search}%"])
-        
-        if country:
-            conditions.append("country = ?")
-            params.append(country)
-        
-        if language:
-            conditions.append("detected_language = ?")
-            params.append(language)
-        
-        if min_subs > 0:
-            conditions.append("subscribers >= ?")
-            params.append(min_subs)
-        
-        if max_subs > 0:
-            conditions.append("subscribers <= ?")
-            params.append(max_subs)
-        
-        where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
+        where_clause, params = _channel_filters(search, country, language, min_subs, max_subs)
         
         query = f"""
             SELECT * FROM channels 
@@ -159,39 +470,78 @@ def get_all_channels(limit: int = 100, offset: int = 0, search: str = "",
         params.extend([limit, offset])
         
         cursor.execute(query, params)
-        return [dict(row) for row in cursor.fetchall()]
+        return _fetch_dicts(cursor)
 
 
-def get_channel_count(search: str = "", country: str = "", language: str = "",
-                      min_subs: int = 0, max_subs: int = 0) -> int:
-    """Get total channel count with filters."""
+def get_channels_page(limit: int = 100, offset: int = 0, search: str = "",
+                      country: str = "", language: str = "",
+                      min_subs: int = 0, max_subs: int = 0) -> Tuple[List[Dict], int]:
+    """Get one page of channels plus the total match count in a single query."""
     with get_db() as conn:
         cursor = conn.cursor()
         
-        conditions = []
-        params = []
-        
-        if search:
-            conditions.append("(channel_title LIKE ? OR description LIKE ?)")
-            params.extend([f"%{search}%", f"%{search}%"])
+        where_clause, params = _channel_filters(search, country, language, min_subs, max_subs)
         
-        if country:
-            conditions.append("country = ?")
-            params.append(country)
-        
-        if language:
-            conditions.append("detected_language = ?")
-            params.append(language)
-        
-        if min_subs > 0:
-            conditions.append("subscribers >= ?")
-            params.append(min_subs)
+        # COUNT(*) OVER() is evaluated before LIMIT, so every row carries the full total
+        cursor.execute(f"""
+            SELECT *, COUNT(*) OVER() AS _total FROM channels 
+            {where_clause}
+            ORDER BY subscribers DESC
+            LIMIT ? OFFSET ?
+        """, params + [limit, offset])
         
-        if max_subs > 0:
-            conditions.append("subscribers <= ?")
-            params.append(max_subs)
+        # The trailing _total column falls off the zip
+        columns = [col[0] for col in cursor.description][:-1]
+        rows = cursor.fetchall()
+    
+    if rows:
+        return [dict(zip(columns, row)) for row in rows], rows[0][-1]
+    
+    # Empty page: only past-the-end offsets need a separate count
+    total = get_channel_count(search, country, language, min_subs, max_subs) if offset else 0
+    return [], total
+
+
+# Columns written by the CSV export, in output order
+CHANNEL_EXPORT_COLUMNS = (
+    "id", "channel_id", "channel_url", "channel_title", "description",
+    "country", "detected_language", "subscribers", "total_views",
+    "video_count", "email", "thumbnail_url", "created_at", "updated_at",
+)
+_SQL_ITER_CHANNELS = f"""
+    SELECT {", ".join(CHANNEL_EXPORT_COLUMNS)} FROM channels
+    ORDER BY subscribers DESC LIMIT ?
+"""
+
+
+def iter_channels(limit: int = 10000, batch_size: int = 500) -> Iterator[Tuple]:
+    """
+    Yield channel rows (CHANNEL_EXPORT_COLUMNS values), highest subscribers first.
+    The first item is CHANNEL_EXPORT_COLUMNS itself (the CSV header).
+    
+    Uses its own connection so a streaming consumer can resume it from any
+    thread without holding the thread-local connection open.
+    """
+    yield CHANNEL_EXPORT_COLUMNS
+    conn = _connect(check_same_thread=False)
+    try:
+        cursor = conn.execute(_SQL_ITER_CHANNELS, (limit,))
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield from rows
+    finally:
+        conn.close()
+
+
+def get_channel_count(search: str = "", country: str = "", language: str = "",
+                      min_subs: int = 0, max_subs: int = 0) -> int:
+    """Get total channel count with filters."""
+    with get_db() as conn:
+        cursor = conn.cursor()
         
-        where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
+        where_clause, params = _channel_filters(search, country, language, min_subs, max_subs)
         
         cursor.execute(f"SELECT COUNT(*) FROM channels {where_clause}", params)
         return cursor.fetchone()[0]
@@ -203,6 +553,7 @@ def clear_all_channels():
         cursor = conn.cursor()
         cursor.execute("DELETE FROM channels")
         conn.commit()
+        _invalidate_cache()
         return cursor.rowcount
 
 
@@ -222,12 +573,33 @@ def get_unique_languages() -> List[str]:
         return [row[0] for row in cursor.fetchall()]
 
 
-def get_existing_channel_ids() -> set:
-    """Get all existing channel IDs."""
+def get_channel_by_id(channel_id: str) -> Optional[Dict]:
+    """Get a single channel by its YouTube channel ID."""
     with get_db() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT channel_id FROM channels")
-        return {row[0] for row in cursor.fetchall()}
+        cursor.execute("SELECT * FROM channels WHERE channel_id = ?", (channel_id,))
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
+
+def get_existing_channel_ids(channel_ids: List[str] = None) -> set:
+    """Get existing channel IDs - all of them, or only those among channel_ids."""
+    with get_db() as conn:
+        cursor = conn.cursor()
+        if channel_ids is None:
+            cursor.execute("SELECT channel_id FROM channels")
+            return {row[0] for row in cursor.fetchall()}
+        
+        # Look the candidates up by index, in chunks below SQLite's variable limit
+        existing = set()
+        for i in range(0, len(channel_ids), 500):
+            chunk = channel_ids[i:i + 500]
+            cursor.execute(
+                f"SELECT channel_id FROM channels WHERE channel_id IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            existing.update(row[0] for row in cursor.fetchall())
+        return existing
 
 
 def add_channel(channel_data: Dict) -> bool:
@@ -255,17 +627,56 @@ def add_channel(channel_data: Dict) -> bool:
                 channel_data.get("thumbnail_url", ""),
             ))
             conn.commit()
+            _invalidate_cache()
             return True
         except sqlite3.IntegrityError:
             return False
 
 
+def add_channels_bulk(channels: List[Dict]) -> int:
+    """Add multiple channels in one transaction, skipping existing ones."""
+    rows = [
+        (
+            channel_data.get("channel_id"),
+            channel_data.get("channel_url"),
+            channel_data.get("channel_title"),
+            channel_data.get("description"),
+            channel_data.get("country"),
+            channel_data.get("detected_language"),
+            channel_data.get("subscribers", 0),
+            channel_data.get("total_views", 0),
+            channel_data.get("video_count", 0),
+            channel_data.get("email", ""),
+            channel_data.get("thumbnail_url", ""),
+        )
+        for channel_data in channels
+    ]
+    if not rows:
+        return 0
+    
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        cursor.executemany("""
+            INSERT OR IGNORE INTO channels (
+                channel_id, channel_url, channel_title, description,
+                country, detected_language, subscribers, total_views,
+                video_count, email, thumbnail_url
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+        added = cursor.rowcount
+        conn.commit()
+        _invalidate_cache()
+        return added
+
+
 def delete_channel(channel_id: str) -> bool:
     """Delete a channel by ID."""
     with get_db() as conn:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM channels WHERE channel_id = ?", (channel_id,))
         conn.commit()
+        _invalidate_cache()
         return cursor.rowcount > 0
 
 
@@ -277,7 +688,7 @@ def get_search_queries(active_only: bool = False) -> List[Dict]:
             cursor.execute("SELECT * FROM search_queries WHERE is_active = 1")
         else:
             cursor.execute("SELECT * FROM search_queries")
-        return [dict(row) for row in cursor.fetchall()]
+        return _fetch_dicts(cursor)
 
 
 def add_search_query(query: str, max_results: int = 25, region_code: str = "US") -> int:
@@ -289,9 +700,28 @@ def add_search_query(query: str, max_results: int = 25, region_code: str = "US")
             (query, max_results, region_code)
         )
         conn.commit()
+        _invalidate_cache()
         return cursor.lastrowid
 
 
+def add_search_queries_bulk(queries: Iterable[str], max_results: int = 25, region_code: str = "US",
+                            clear_existing: bool = False) -> int:
+    """Add multiple search queries in one transaction."""
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        if clear_existing:
+            cursor.execute("DELETE FROM search_queries")
+        cursor.executemany(
+            "INSERT INTO search_queries (query, max_results, region_code) VALUES (?, ?, ?)",
+            ((query, max_results, region_code) for query in queries)
+        )
+        added = cursor.rowcount
+        conn.commit()
+        _invalidate_cache()
+        return added
+
+
 def update_search_query(query_id: int, query: str = None, max_results: int = None, 
                         region_code: str = None, is_active: bool = None) -> bool:
     """Update a search query."""
@@ -322,6 +752,7 @@ def update_search_query(query_id: int, query: str = None, max_results: int = Non
             values
         )
         conn.commit()
+        _invalidate_cache()
         return cursor.rowcount > 0
 
 
@@ -331,72 +762,38 @@ def delete_search_query(query_id: int) -> bool:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM search_queries WHERE id = ?", (query_id,))
         conn.commit()
+        _invalidate_cache()
         return cursor.rowcount > 0
 
 
+def clear_search_queries() -> int:
+    """Delete all search queries."""
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM search_queries")
+        conn.commit()
+        _invalidate_cache()
+        return cursor.rowcount
+
+
 def reset_search_queries_to_creator_focused():
     """Reset search queries to creator-focused defaults (for influencer marketing)."""
     with get_db() as conn:
         cursor = conn.cursor()
+        cursor.execute("BEGIN")
         # Clear existing queries
         cursor.execute("DELETE FROM search_queries")
         
-        # Add creator-focused queries - targeting INDIVIDUALS not brands
-        creator_queries = [
-            # ===== PERSONAL JOURNEY STORIES =====
-            ("how I made my first $10k online", 30, "US"),
-            ("my journey to 100k subscribers", 25, "US"),
-            ("I quit my 9 to 5 job", 25, "US"),
-            ("my first year as entrepreneur", 25, "US"),
-            ("how I started my online business from scratch", 25, "US"),
-            
-            # ===== INCOME/RESULTS REPORTS =====
-            ("income report youtuber", 25, "US"),
-            ("how much I made this month", 25, "US"),
-            ("revealing my earnings", 25, "US"),
-            ("my affiliate marketing income", 25, "US"),
-            ("dropshipping income proof", 25, "US"),
-            
-            # ===== PERSONAL ADS/MARKETING CONTENT =====
-            ("I spent $1000 on facebook ads", 25, "US"),
-            ("my facebook ads results", 25, "US"),
-            ("testing tiktok ads for my store", 25, "US"),
-            ("my meta ads strategy", 25, "US"),
-            ("I tried google ads for 30 days", 25, "US"),
-            
-            # ===== ECOMMERCE CREATOR STORIES =====
-            ("my shopify store journey", 25, "US"),
-            ("I started dropshipping with $0", 25, "US"),
-            ("my etsy shop income", 25, "US"),
-            ("amazon fba beginner journey", 25, "US"),
-            ("print on demand real results", 25, "US"),
-            
-            # ===== SIDE HUSTLE/ENTREPRENEUR =====
-            ("best side hustles I actually tried", 25, "US"),
-            ("how I make passive income", 25, "US"),
-            ("day in my life online entrepreneur", 25, "US"),
-            ("work from home business ideas that work", 25, "US"),
-            ("my online business income streams", 25, "US"),
-            
-            # ===== YOUTUBE/CONTENT CREATOR GROWTH =====
-            ("how I grew my youtube channel", 25, "US"),
-            ("my content creation journey", 25, "US"),
-            ("youtube monetization tips from experience", 25, "US"),
-            ("growing on social media as beginner", 25, "US"),
-            
-            # ===== NICHE SPECIFIC CREATORS =====
-            ("real estate agent marketing tips", 25, "US"),
-            ("fitness influencer income", 25, "US"),
-            ("travel youtuber behind the scenes", 25, "US"),
-            ("food blogger income report", 25, "US"),
-        ]
-        
-        cursor.executemany(
-            "INSERT INTO search_queries (query, max_results, region_code) VALUES (?, ?, ?)",
-            creator_queries
-        )
+        # Copy the seeded defaults without leaving SQLite
+        cursor.execute("""
+            INSERT INTO search_queries (query, max_results, region_code)
+            SELECT query, max_results, region_code FROM search_query_defaults
+            ORDER BY id
+        """)
+        added = cursor.rowcount
         conn.commit()
-        return len(creator_queries)
+        _invalidate_cache()
+        return added
 
 
 def start_scrape_history() -> int:
@@ -408,6 +805,7 @@ def start_scrape_history() -> int:
             (datetime.now(),)
         )
         conn.commit()
+        _invalidate_cache()
         return cursor.lastrowid
 
 
@@ -423,8 +821,10 @@ def complete_scrape_history(history_id: int, channels_found: int, channels_added
             WHERE id = ?
         """, (datetime.now(), channels_found, channels_added, status, error_message, history_id))
         conn.commit()
+        _invalidate_cache()
 
 
+@_ttl_cache(ttl=2)
 def get_scrape_history(limit: int = 20) -> List[Dict]:
     """Get recent scrape history."""
     with get_db() as conn:
@@ -434,9 +834,11 @@ def get_scrape_history(limit: int = 20) -> List[Dict]:
             ORDER BY started_at DESC 
             LIMIT ?
         """, (limit,))
-        return [dict(row) for row in cursor.fetchall()]
+        return _fetch_dicts(cursor)
 
 
+# Polled by the dashboard - a short TTL collapses concurrent refreshes into one query
+@_ttl_cache(ttl=2)
 def get_stats() -> Dict:
     """Get dashboard statistics."""
     with get_db() as conn:
@@ -495,171 +897,181 @@ def get_stats() -> Dict:
 # EMAIL ACCOUNTS MANAGEMENT
 # ============================================================
 
-def init_email_tables():
-    """Initialize email-related tables."""
-    with get_db() as conn:
-        cursor = conn.cursor()
-        
-        # Email accounts table (SMTP credentials)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS email_accounts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                email TEXT UNIQUE NOT NULL,
-                smtp_host TEXT NOT NULL,
-                smtp_port INTEGER DEFAULT 587,
-                smtp_user TEXT NOT NULL,
-                smtp_password TEXT NOT NULL,
-                display_name TEXT,
-                is_active BOOLEAN DEFAULT 1,
-                last_used TIMESTAMP,
-                emails_sent_today INTEGER DEFAULT 0,
-                daily_limit INTEGER DEFAULT 50,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Campaigns table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS campaigns (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                brief TEXT,
-                budget_min REAL,
-                budget_max REAL,
-                max_offer REAL DEFAULT 500,
-                offer_increment REAL DEFAULT 50,
-                topic TEXT,
-                requirements TEXT,
-                deadline TEXT,
-                status TEXT DEFAULT 'draft',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Outreach emails table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS outreach_emails (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                campaign_id INTEGER,
-                channel_id TEXT,
-                email_account_id INTEGER,
-                recipient_email TEXT,
-                subject TEXT,
-                body TEXT,
-                status TEXT DEFAULT 'draft',
-                sent_at TIMESTAMP,
-                opened_at TIMESTAMP,
-                replied_at TIMESTAMP,
-                reply_content TEXT,
-                ai_response TEXT,
-                negotiation_stage TEXT DEFAULT 'initial',
-                current_offer REAL DEFAULT 0,
-                negotiation_rounds INTEGER DEFAULT 0,
-                followup_count INTEGER DEFAULT 0,
-                last_followup_at TIMESTAMP,
-                last_inbound_at TIMESTAMP,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (campaign_id) REFERENCES campaigns(id),
-                FOREIGN KEY (email_account_id) REFERENCES email_accounts(id)
-            )
-        """)
-        
-        # Email threads table (for tracking conversations)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS email_threads (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                outreach_id INTEGER,
-                direction TEXT,
-                subject TEXT,
-                body TEXT,
-                message_hash TEXT,
-                sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (outreach_id) REFERENCES outreach_emails(id)
-            )
-        """)
-        
-        # Processed email IDs to prevent duplicates
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS processed_emails (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                message_id TEXT UNIQUE,
-                from_email TEXT,
-                subject TEXT,
-                body_hash TEXT,
-                processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Mailing list table (for bulk outreach)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS mailing_list (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                email TEXT NOT NULL,
-                channel_id TEXT,
-                channel_title TEXT,
-                subscribers INTEGER,
-                notes TEXT,
-                status TEXT DEFAULT 'pending',
-                campaign_id INTEGER,
-                outreach_id INTEGER,
-                added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (campaign_id) REFERENCES campaigns(id),
-                FOREIGN KEY (outreach_id) REFERENCES outreach_emails(id)
-            )
-        """)
-        
-        conn.commit()
-        
-        # Run migrations to add new columns to existing tables
-        migrate_database(conn)
+# Sends counted in memory since the last flush_email_sent_counts() call
+_send_counts_lock = threading.Lock()
+_pending_counts: Dict[int, int] = defaultdict(int)
+_last_used: Dict[int, datetime] = {}
+# Counts a flush has taken from _pending_counts but not yet committed
+_flushing_counts: Dict[int, int] = defaultdict(int)
 
 
-def migrate_database(conn):
-    """Add missing columns to existing tables (for upgrades)."""
+def init_email_tables(conn):
+    """Initialize email-related tables (runs inside init_db's transaction)."""
     cursor = conn.cursor()
     
-    def column_exists(table, column):
-        """Check if a column exists in a table using SQLite pragma."""
-        cursor.execute(f"PRAGMA table_info({table})")
-        columns = [row[1] for row in cursor.fetchall()]
-        return column in columns
+    # Email accounts table (SMTP credentials)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS email_accounts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email TEXT UNIQUE NOT NULL,
+            smtp_host TEXT NOT NULL,
+            smtp_port INTEGER DEFAULT 587,
+            smtp_user TEXT NOT NULL,
+            smtp_password TEXT NOT NULL,
+            display_name TEXT,
+            is_active BOOLEAN DEFAULT 1,
+            last_used TIMESTAMP,
+            emails_sent_today INTEGER DEFAULT 0,
+            daily_limit INTEGER DEFAULT 50,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
     
-    def add_column_if_missing(table, column, col_type, default=None):
-        """Add column if it doesn't exist."""
-        if not column_exists(table, column):
-            default_clause = f" DEFAULT {default}" if default is not None else ""
-            try:
-                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {col_type}{default_clause}")
-                print(f"Added {column} column to {table}")
-            except Exception as e:
-                print(f"Error adding {column} to {table}: {e}")
+    # Campaigns table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS campaigns (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            brief TEXT,
+            budget_min REAL,
+            budget_max REAL,
+            max_offer REAL DEFAULT 500,
+            offer_increment REAL DEFAULT 50,
+            topic TEXT,
+            requirements TEXT,
+            deadline TEXT,
+            status TEXT DEFAULT 'draft',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
     
-    # Add missing columns to campaigns table
-    add_column_if_missing('campaigns', 'max_offer', 'REAL', 500)
-    add_column_if_missing('campaigns', 'offer_increment', 'REAL', 50)
+    # Outreach emails table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS outreach_emails (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            campaign_id INTEGER,
+            channel_id TEXT,
+            email_account_id INTEGER,
+            recipient_email TEXT,
+            subject TEXT,
+            body TEXT,
+            status TEXT DEFAULT 'draft',
+            sent_at TIMESTAMP,
+            opened_at TIMESTAMP,
+            replied_at TIMESTAMP,
+            reply_content TEXT,
+            ai_response TEXT,
+            negotiation_stage TEXT DEFAULT 'initial',
+            current_offer REAL DEFAULT 0,
+            negotiation_rounds INTEGER DEFAULT 0,
+            followup_count INTEGER DEFAULT 0,
+            last_followup_at TIMESTAMP,
+            last_inbound_at TIMESTAMP,
+            inbound_count INTEGER DEFAULT 0,
+            outbound_count INTEGER DEFAULT 0,
+            last_outbound_at TIMESTAMP,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (campaign_id) REFERENCES campaigns(id),
+            FOREIGN KEY (email_account_id) REFERENCES email_accounts(id)
+        )
+    """)
     
-    # Add missing columns to outreach_emails table
-    add_column_if_missing('outreach_emails', 'current_offer', 'REAL', 0)
-    add_column_if_missing('outreach_emails', 'negotiation_rounds', 'INTEGER', 0)
-    add_column_if_missing('outreach_emails', 'followup_count', 'INTEGER', 0)
-    add_column_if_missing('outreach_emails', 'last_followup_at', 'TIMESTAMP', None)
-    add_column_if_missing('outreach_emails', 'last_inbound_at', 'TIMESTAMP', None)
+    # Email threads table (for tracking conversations)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS email_threads (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            outreach_id INTEGER,
+            direction TEXT,
+            subject TEXT,
+            body TEXT,
+            message_hash TEXT,
+            sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (outreach_id) REFERENCES outreach_emails(id)
+        )
+    """)
     
-    # Create processed_emails table if it doesn't exist
+    # Processed email IDs to prevent duplicates
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS processed_emails (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             message_id TEXT UNIQUE,
             from_email TEXT,
             subject TEXT,
-            body_hash TEXT,
+            body_hash BLOB,
             processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_processed_body_hash ON processed_emails(body_hash)")
+    
+    # Mailing list table (for bulk outreach)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS mailing_list (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            email TEXT NOT NULL,
+            channel_id TEXT,
+            channel_title TEXT,
+            subscribers INTEGER,
+            notes TEXT,
+            status TEXT DEFAULT 'pending',
+            campaign_id INTEGER,
+            outreach_id INTEGER,
+            added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (campaign_id) REFERENCES campaigns(id),
+            FOREIGN KEY (outreach_id) REFERENCES outreach_emails(id)
+        )
+    """)
     
-    conn.commit()
+    # Composite indexes matching the equality filters + ORDER BY of hot queries
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_email_accounts_available
+        ON email_accounts(is_active, emails_sent_today)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_outreach_campaign_status_created
+        ON outreach_emails(campaign_id, status, created_at DESC)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_outreach_status_created
+        ON outreach_emails(status, created_at DESC)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_threads_outreach_sent
+        ON email_threads(outreach_id, sent_at)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_threads_outreach_direction
+        ON email_threads(outreach_id, direction, sent_at)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_mailing_campaign_status_added
+        ON mailing_list(campaign_id, status, added_at DESC)
+    """)
+
+
+def migrate_database(conn):
+    """Add missing columns to existing tables (runs inside init_db's transaction)."""
+    cursor = conn.cursor()
+
+    # Read each table's columns once instead of once per candidate column
+    existing = {}
+    for table, _, _, _ in MIGRATION_COLUMNS:
+        if table not in existing:
+            cursor.execute(f"PRAGMA table_info({table})")
+            existing[table] = {row[1] for row in cursor.fetchall()}
+
+    for table, column, col_type, default in MIGRATION_COLUMNS:
+        if column in existing[table]:
+            continue
+        default_clause = f" DEFAULT {default}" if default is not None else ""
+        try:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {col_type}{default_clause}")
+            existing[table].add(column)
+            print(f"Added {column} column to {table}")
+        except Exception as e:
+            print(f"Error adding {column} to {table}: {e}")
+
     print("Database migration complete.")
 
 
@@ -676,11 +1088,28 @@ def add_email_account(email: str, smtp_host: str, smtp_port: int,
                 VALUES (?, ?, ?, ?, ?, ?, ?)
             """, (email, smtp_host, smtp_port, smtp_user, smtp_password, display_name, daily_limit))
             conn.commit()
+            _invalidate_cache()
             return cursor.lastrowid
         except sqlite3.IntegrityError:
             return -1
 
 
+def _unflushed_count(account_id: int) -> int:
+    """Sends not yet committed to the DB (caller holds _send_counts_lock)."""
+    return _pending_counts.get(account_id, 0) + _flushing_counts.get(account_id, 0)
+
+
+def _with_pending_counts(account: Dict) -> Dict:
+    """Overlay sends not yet flushed to the DB onto an account row."""
+    with _send_counts_lock:
+        pending = _unflushed_count(account['id'])
+        if pending:
+            account['emails_sent_today'] = (account['emails_sent_today'] or 0) + pending
+        if account['id'] in _last_used:
+            account['last_used'] = _last_used[account['id']]
+    return account
+
+
 def get_email_accounts(active_only: bool = False) -> List[Dict]:
     """Get all email accounts."""
     with get_db() as conn:
@@ -689,7 +1118,7 @@ def get_email_accounts(active_only: bool = False) -> List[Dict]:
             cursor.execute("SELECT * FROM email_accounts WHERE is_active = 1")
         else:
             cursor.execute("SELECT * FROM email_accounts")
-        return [dict(row) for row in cursor.fetchall()]
+        return [_with_pending_counts(account) for account in _fetch_dicts(cursor)]
 
 
 def get_email_account(account_id: int) -> Optional[Dict]:
@@ -698,6 +1127,22 @@ def get_email_account(account_id: int) -> Optional[Dict]:
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM email_accounts WHERE id = ?", (account_id,))
         row = cursor.fetchone()
+        return _with_pending_counts(dict(row)) if row else None
+
+
+def get_next_available_account() -> Optional[Dict]:
+    """Get the least-used active account that is still under its daily limit."""
+    # Make sure buffered sends count towards the limit check
+    flush_email_sent_counts()
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT * FROM email_accounts 
+            WHERE is_active = 1 AND emails_sent_today < daily_limit
+            ORDER BY emails_sent_today ASC
+            LIMIT 1
+        """)
+        row = cursor.fetchone()
         return dict(row) if row else None
 
 
@@ -707,10 +1152,11 @@ def update_email_account(account_id: int, **kwargs) -> bool:
         return False
     with get_db() as conn:
         cursor = conn.cursor()
-        updates = ", ".join([f"{k} = ?" for k in kwargs.keys()])
-        values = list(kwargs.values()) + [account_id]
-        cursor.execute(f"UPDATE email_accounts SET {updates} WHERE id = ?", values)
+        columns = tuple(sorted(kwargs))
+        values = [kwargs[column] for column in columns] + [account_id]
+        cursor.execute(_build_update_sql('email_accounts', columns), values)
         conn.commit()
+        _invalidate_cache()
         return cursor.rowcount > 0
 
 
@@ -720,23 +1166,91 @@ def delete_email_account(account_id: int) -> bool:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM email_accounts WHERE id = ?", (account_id,))
         conn.commit()
+        _invalidate_cache()
         return cursor.rowcount > 0
 
 
-def increment_email_sent(account_id: int):
-    """Increment the emails sent counter for an account."""
+def reserve_email_send(account_id: int) -> bool:
+    """
+    Count a send against an active account's daily limit before it happens.
+    Returns False if the account is inactive or has no quota left. The check
+    and the count happen under one lock, so concurrent senders can't overshoot
+    the limit. Call refund_email_send() if the send then fails.
+    """
+    with _send_counts_lock:
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT emails_sent_today, daily_limit FROM email_accounts 
+                WHERE id = ? AND is_active = 1
+            """, (account_id,))
+            row = cursor.fetchone()
+        if not row or (row['emails_sent_today'] or 0) + _unflushed_count(account_id) >= row['daily_limit']:
+            return False
+        _pending_counts[account_id] += 1
+        _last_used[account_id] = datetime.now()
+        return True
+
+
+def refund_email_send(account_id: int):
+    """Give back a reserve_email_send() slot after the send failed."""
+    with _send_counts_lock:
+        if _pending_counts.get(account_id, 0) > 0:
+            _pending_counts[account_id] -= 1
+            return
+    
+    # The reservation was already flushed - take it off the stored count
     with get_db() as conn:
         cursor = conn.cursor()
         cursor.execute("""
             UPDATE email_accounts 
-            SET emails_sent_today = emails_sent_today + 1, last_used = ?
+            SET emails_sent_today = MAX(emails_sent_today - 1, 0)
             WHERE id = ?
-        """, (datetime.now(), account_id))
+        """, (account_id,))
         conn.commit()
 
 
+def flush_email_sent_counts():
+    """Write buffered sent counts to the DB in a single transaction."""
+    global _pending_counts, _last_used
+    with _send_counts_lock:
+        if not _pending_counts:
+            return
+        counts, last_used = _pending_counts, _last_used
+        _pending_counts, _last_used = defaultdict(int), {}
+        # Keep counting them towards the limits until the UPDATE commits
+        for account_id, count in counts.items():
+            _flushing_counts[account_id] += count
+    
+    try:
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                UPDATE email_accounts 
+                SET emails_sent_today = emails_sent_today + ?, last_used = ?
+                WHERE id = ?
+            """, [(count, last_used[account_id], account_id) for account_id, count in counts.items()])
+            conn.commit()
+    except Exception:
+        # Put the counts back so the next flush retries them
+        with _send_counts_lock:
+            for account_id, count in counts.items():
+                _pending_counts[account_id] += count
+                _last_used.setdefault(account_id, last_used[account_id])
+        raise
+    finally:
+        with _send_counts_lock:
+            for account_id, count in counts.items():
+                _flushing_counts[account_id] -= count
+                if not _flushing_counts[account_id]:
+                    del _flushing_counts[account_id]
+
+
 def reset_daily_email_counts():
     """Reset daily email counts for all accounts (call daily)."""
+    with _send_counts_lock:
+        _pending_counts.clear()
+        _last_used.clear()
     with get_db() as conn:
         cursor = conn.cursor()
         cursor.execute("UPDATE email_accounts SET emails_sent_today = 0")
@@ -760,6 +1274,7 @@ def create_campaign(name: str, brief: str = "", budget_min: float = 0,
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 'draft')
         """, (name, brief, budget_min, budget_max, max_offer, offer_increment, topic, requirements, deadline))
         conn.commit()
+        _invalidate_cache()
         return cursor.lastrowid
 
 
@@ -771,7 +1286,7 @@ def get_campaigns(status: str = None) -> List[Dict]:
             cursor.execute("SELECT * FROM campaigns WHERE status = ? ORDER BY created_at DESC", (status,))
         else:
             cursor.execute("SELECT * FROM campaigns ORDER BY created_at DESC")
-        return [dict(row) for row in cursor.fetchall()]
+        return _fetch_dicts(cursor)
 
 
 def get_campaign(campaign_id: int) -> Optional[Dict]:
@@ -790,10 +1305,11 @@ def update_campaign(campaign_id: int, **kwargs) -> bool:
     kwargs['updated_at'] = datetime.now()
     with get_db() as conn:
         cursor = conn.cursor()
-        updates = ", ".join([f"{k} = ?" for k in kwargs.keys()])
-        values = list(kwargs.values()) + [campaign_id]
-        cursor.execute(f"UPDATE campaigns SET {updates} WHERE id = ?", values)
+        columns = tuple(sorted(kwargs))
+        values = [kwargs[column] for column in columns] + [campaign_id]
+        cursor.execute(_build_update_sql('campaigns', columns), values)
         conn.commit()
+        _invalidate_cache()
         return cursor.rowcount > 0
 
 
@@ -803,6 +1319,7 @@ def delete_campaign(campaign_id: int) -> bool:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM campaigns WHERE id = ?", (campaign_id,))
         conn.commit()
+        _invalidate_cache()
         return cursor.rowcount > 0
 
 
@@ -821,11 +1338,55 @@ def create_outreach(campaign_id: int, channel_id: str, recipient_email: str,
             VALUES (?, ?, ?, ?, ?, ?, 'draft')
         """, (campaign_id, channel_id, email_account_id, recipient_email, subject, body))
         conn.commit()
+        _invalidate_cache()
         return cursor.lastrowid
 
 
-def get_outreach_emails(campaign_id: int = None, status: str = None) -> List[Dict]:
-    """Get outreach emails with optional filters."""
+def create_outreach_bulk(items: List[Tuple]) -> List[int]:
+    """Create many draft outreach emails in one transaction.
+    
+    Each item is (campaign_id, channel_id, email_account_id, recipient_email, subject, body).
+    Returns the new outreach IDs in the same order as items.
+    """
+    if not items:
+        return []
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        cursor.executemany("""
+            INSERT INTO outreach_emails 
+            (campaign_id, channel_id, email_account_id, recipient_email, subject, body, status)
+            VALUES (?, ?, ?, ?, ?, ?, 'draft')
+        """, items)
+        # The write lock is held for the whole batch, so the rowids are consecutive
+        cursor.execute("SELECT last_insert_rowid()")
+        last_id = cursor.fetchone()[0]
+        conn.commit()
+        _invalidate_cache()
+    return list(range(last_id - len(items) + 1, last_id + 1))
+
+
+# Listing columns; the large text columns are only loaded on request
+OUTREACH_LIST_COLUMNS = """
+    o.id, o.campaign_id, o.channel_id, o.email_account_id, o.recipient_email,
+    o.subject, o.status, o.sent_at, o.opened_at, o.replied_at,
+    o.negotiation_stage, o.current_offer, o.negotiation_rounds, o.followup_count,
+    o.last_followup_at, o.last_inbound_at, o.inbound_count, o.outbound_count,
+    o.last_outbound_at, o.created_at
+"""
+OUTREACH_TEXT_COLUMNS = "o.body, o.reply_content, o.ai_response"
+
+
+def get_outreach_emails(campaign_id: int = None, status: str = None,
+                        include_body: bool = False, include_channel: bool = True,
+                        limit: int = None, before_id: int = None) -> List[Dict]:
+    """Get outreach emails with optional filters, newest first.
+    
+    The body, reply_content and ai_response columns are only included
+    when include_body is True; the channel join is skipped when
+    include_channel is False. Pass limit to page through results and the
+    last row's id as before_id to fetch the next page.
+    """
     with get_db() as conn:
         cursor = conn.cursor()
         conditions = []
@@ -837,29 +1398,44 @@ def get_outreach_emails(campaign_id: int = None, status: str = None) -> List[Dic
         if status:
             conditions.append("o.status = ?")
             params.append(status)
+        if before_id:
+            # Keyset pagination on (created_at, id) - no OFFSET scan
+            conditions.append("""(o.created_at, o.id) < (
+                SELECT created_at, id FROM outreach_emails WHERE id = ?)""")
+            params.append(before_id)
         
         where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
+        limit_clause = ""
+        if limit:
+            limit_clause = "LIMIT ?"
+            params.append(limit)
+        columns = OUTREACH_LIST_COLUMNS
+        if include_body:
+            columns += ", " + OUTREACH_TEXT_COLUMNS
+        
+        if include_channel:
+            columns += ", c.channel_title, c.subscribers, c.thumbnail_url"
+            join_clause = "LEFT JOIN channels c ON o.channel_id = c.channel_id"
+        else:
+            join_clause = ""
         
         cursor.execute(f"""
-            SELECT o.*, c.channel_title, c.subscribers, c.thumbnail_url
+            SELECT {columns}
             FROM outreach_emails o
-            LEFT JOIN channels c ON o.channel_id = c.channel_id
+            {join_clause}
             {where_clause}
-            ORDER BY o.created_at DESC
+            ORDER BY o.created_at DESC, o.id DESC
+            {limit_clause}
         """, params)
-        return [dict(row) for row in cursor.fetchall()]
+        
+        return _fetch_dicts(cursor, batch_size=500)
 
 
 def get_outreach(outreach_id: int) -> Optional[Dict]:
     """Get a single outreach email by ID."""
     with get_db() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-            SELECT o.*, c.channel_title, c.subscribers, c.thumbnail_url
-            FROM outreach_emails o
-            LEFT JOIN channels c ON o.channel_id = c.channel_id
-            WHERE o.id = ?
-        """, (outreach_id,))
+        cursor.execute(_SQL_GET_OUTREACH, (outreach_id,))
         row = cursor.fetchone()
         return dict(row) if row else None
 
@@ -870,10 +1446,11 @@ def update_outreach(outreach_id: int, **kwargs) -> bool:
         return False
     with get_db() as conn:
         cursor = conn.cursor()
-        updates = ", ".join([f"{k} = ?" for k in kwargs.keys()])
-        values = list(kwargs.values()) + [outreach_id]
-        cursor.execute(f"UPDATE outreach_emails SET {updates} WHERE id = ?", values)
+        columns = tuple(sorted(kwargs))
+        values = [kwargs[column] for column in columns] + [outreach_id]
+        cursor.execute(_build_update_sql('outreach_emails', columns), values)
         conn.commit()
+        _invalidate_cache()
         return cursor.rowcount > 0
 
 
@@ -894,6 +1471,59 @@ def mark_outreach_sent(outreach_id: int, email_account_id: int = None):
                 WHERE id = ?
             """, (datetime.now(), outreach_id))
         conn.commit()
+        _invalidate_cache()
+
+
+def claim_outreach_for_send(outreach_id: int) -> Optional[Dict]:
+    """Atomically mark an unsent outreach as sent and return what to send.
+    
+    Returns None when it doesn't exist, was already sent or has no recipient,
+    so concurrent senders can never both claim the same email. The result also
+    carries the row's prior status and sent_at for release_outreach_claim.
+    
+    The claim commits before the SMTP send. If the process dies before the
+    caller records the send, the row stays 'sent' without an outbound thread
+    entry: the email is never sent twice, but it may not have been sent at all.
+    """
+    with get_db() as conn:
+        cursor = conn.cursor()
+        # Take the write lock up front so the read and the update see the same row
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.execute("""
+                SELECT status, sent_at FROM outreach_emails 
+                WHERE id = ? AND status != 'sent'
+                  AND recipient_email IS NOT NULL AND recipient_email != ''
+            """, (outreach_id,))
+            prior = cursor.fetchone()
+            if not prior:
+                return None
+            cursor.execute("""
+                UPDATE outreach_emails 
+                SET status = 'sent', sent_at = ?
+                WHERE id = ?
+                RETURNING recipient_email, subject, body, email_account_id
+            """, (datetime.now(), outreach_id))
+            claim = dict(cursor.fetchone())
+        finally:
+            conn.commit()
+    _invalidate_cache()
+    claim['prior_status'] = prior['status']
+    claim['prior_sent_at'] = prior['sent_at']
+    return claim
+
+
+def release_outreach_claim(outreach_id: int, claim: Dict):
+    """Undo claim_outreach_for_send after a failed send, restoring the prior status."""
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            UPDATE outreach_emails 
+            SET status = ?, sent_at = ?
+            WHERE id = ? AND status = 'sent'
+        """, (claim['prior_status'], claim['prior_sent_at'], outreach_id))
+        conn.commit()
+        _invalidate_cache()
 
 
 def add_email_thread(outreach_id: int, direction: str, subject: str, body: str) -> int:
@@ -908,85 +1538,175 @@ def add_email_thread(outreach_id: int, direction: str, subject: str, body: str)
         return cursor.lastrowid
 
 
-def get_email_thread(outreach_id: int) -> List[Dict]:
-    """Get all messages in an email thread."""
+def get_email_thread(outreach_id: int, limit: int = None, after_id: int = None) -> List[Dict]:
+    """Get messages in an email thread, oldest first.
+    
+    Pass limit to page through long threads and the last row's id as
+    after_id to fetch the next page.
+    """
     with get_db() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-            SELECT * FROM email_threads 
-            WHERE outreach_id = ? 
-            ORDER BY sent_at ASC
-        """, (outreach_id,))
-        return [dict(row) for row in cursor.fetchall()]
+        if after_id:
+            cursor.execute(_SQL_GET_EMAIL_THREAD_PAGE, (outreach_id, after_id, limit or -1))
+        elif limit:
+            cursor.execute(_SQL_GET_EMAIL_THREAD + " LIMIT ?", (outreach_id, limit))
+        else:
+            cursor.execute(_SQL_GET_EMAIL_THREAD, (outreach_id,))
+        return _fetch_dicts(cursor)
 
 
-def is_email_processed(message_id: str = None, body_hash: str = None) -> bool:
-    """Check if an email has already been processed."""
+def get_outreach_with_thread(outreach_id: int) -> Tuple[Optional[Dict], List[Dict]]:
+    """Get an outreach email and its thread (oldest first) in one read transaction."""
     with get_db() as conn:
         cursor = conn.cursor()
-        if message_id:
-            cursor.execute("SELECT id FROM processed_emails WHERE message_id = ?", (message_id,))
-            if cursor.fetchone():
-                return True
-        if body_hash:
-            cursor.execute("SELECT id FROM processed_emails WHERE body_hash = ?", (body_hash,))
-            if cursor.fetchone():
-                return True
+        cursor.execute("BEGIN")
+        try:
+            cursor.execute(_SQL_GET_OUTREACH, (outreach_id,))
+            row = cursor.fetchone()
+            if not row:
+                return None, []
+            cursor.execute(_SQL_GET_EMAIL_THREAD, (outreach_id,))
+            return dict(row), _fetch_dicts(cursor)
+        finally:
+            conn.commit()
+
+
+class _BloomFilter:
+    """Fixed-size Bloom filter over str/bytes keys (blake2b double hashing)."""
+    
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = capacity
+        self.size = max(64, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+    
+    def _positions(self, key: bytes):
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+    
+    def add(self, key: bytes):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+    
+    def __contains__(self, key: bytes) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+# In-memory front for is_email_processed: a miss means "definitely not processed"
+_processed_filter: Optional[_BloomFilter] = None
+_processed_filter_max_id = 0
+_processed_filter_lock = threading.Lock()
+
+
+def _processed_keys(message_id: str = None, body_hash: bytes = None) -> List[bytes]:
+    """Filter keys for a processed email, prefixed so the two kinds never collide."""
+    keys = []
+    if message_id:
+        keys.append(b"m:" + message_id.encode())
+    if body_hash:
+        keys.append(b"h:" + bytes(body_hash))
+    return keys
+
+
+def sync_processed_filter():
+    """Load processed_emails rows added since the last sync into the Bloom filter."""
+    global _processed_filter, _processed_filter_max_id
+    with _processed_filter_lock:
+        with get_db() as conn:
+            cursor = conn.cursor()
+            # Rebuild from scratch on first use or once the filter is over capacity
+            if _processed_filter is None or _processed_filter.count > _processed_filter.capacity:
+                cursor.execute("SELECT COUNT(*) FROM processed_emails")
+                _processed_filter = _BloomFilter(capacity=max(10000, cursor.fetchone()[0] * 4))
+                _processed_filter_max_id = 0
+            
+            cursor.execute(
+                "SELECT id, message_id, body_hash FROM processed_emails WHERE id > ?",
+                (_processed_filter_max_id,)
+            )
+            for row_id, message_id, body_hash in cursor.fetchall():
+                for key in _processed_keys(message_id, body_hash):
+                    _processed_filter.add(key)
+                _processed_filter_max_id = max(_processed_filter_max_id, row_id)
+
+
+def is_email_processed(message_id: str = None, body_hash: bytes = None) -> bool:
+    """Check if an email has already been processed."""
+    if message_id and body_hash:
+        sql, params = _SQL_PROCESSED_BY_EITHER, (message_id, sqlite3.Binary(body_hash))
+    elif message_id:
+        sql, params = _SQL_PROCESSED_BY_MESSAGE_ID, (message_id,)
+    elif body_hash:
+        sql, params = _SQL_PROCESSED_BY_BODY_HASH, (sqlite3.Binary(body_hash),)
+    else:
+        return False
+    
+    if _processed_filter is None:
+        sync_processed_filter()
+    # Only possible positives need to hit SQLite
+    if not any(key in _processed_filter for key in _processed_keys(message_id, body_hash)):
         return False
+    
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute(sql, params)
+        return cursor.fetchone() is not None
 
 
-def mark_email_processed(message_id: str, from_email: str, subject: str, body_hash: str):
-    """Mark an email as processed to prevent duplicate handling."""
+def mark_emails_processed(rows: List[Tuple]):
+    """Mark many emails as processed in one transaction.
+    
+    Each row is (message_id, from_email, subject, body_hash); duplicates are ignored.
+    """
+    if not rows:
+        return
+    params = [
+        (message_id, from_email, subject, sqlite3.Binary(body_hash) if body_hash else None)
+        for message_id, from_email, subject, body_hash in rows
+    ]
     with get_db() as conn:
         cursor = conn.cursor()
-        try:
-            cursor.execute("""
-                INSERT OR IGNORE INTO processed_emails (message_id, from_email, subject, body_hash)
-                VALUES (?, ?, ?, ?)
-            """, (message_id, from_email, subject, body_hash))
-            conn.commit()
-        except:
-            pass  # Ignore duplicates
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany("""
+            INSERT OR IGNORE INTO processed_emails (message_id, from_email, subject, body_hash)
+            VALUES (?, ?, ?, ?)
+        """, params)
+        conn.commit()
+    
+    with _processed_filter_lock:
+        if _processed_filter is not None:
+            for message_id, _, _, body_hash in rows:
+                for key in _processed_keys(message_id, body_hash):
+                    _processed_filter.add(key)
+
+
+def mark_email_processed(message_id: str, from_email: str, subject: str, body_hash: bytes):
+    """Mark an email as processed to prevent duplicate handling."""
+    mark_emails_processed([(message_id, from_email, subject, body_hash)])
 
 
 def get_thread_stats(outreach_id: int) -> Dict:
-    """Get stats about an email thread."""
+    """Get stats about an email thread (maintained on outreach_emails by trigger)."""
     with get_db() as conn:
         cursor = conn.cursor()
-        
-        # Count inbound messages
         cursor.execute("""
-            SELECT COUNT(*) FROM email_threads 
-            WHERE outreach_id = ? AND direction = 'inbound'
+            SELECT inbound_count, outbound_count, last_inbound_at, last_outbound_at
+            FROM outreach_emails WHERE id = ?
         """, (outreach_id,))
-        inbound_count = cursor.fetchone()[0]
-        
-        # Count outbound messages
-        cursor.execute("""
-            SELECT COUNT(*) FROM email_threads 
-            WHERE outreach_id = ? AND direction = 'outbound'
-        """, (outreach_id,))
-        outbound_count = cursor.fetchone()[0]
-        
-        # Get last inbound time
-        cursor.execute("""
-            SELECT MAX(sent_at) FROM email_threads 
-            WHERE outreach_id = ? AND direction = 'inbound'
-        """, (outreach_id,))
-        last_inbound = cursor.fetchone()[0]
-        
-        # Get last outbound time
-        cursor.execute("""
-            SELECT MAX(sent_at) FROM email_threads 
-            WHERE outreach_id = ? AND direction = 'outbound'
-        """, (outreach_id,))
-        last_outbound = cursor.fetchone()[0]
+        row = cursor.fetchone()
+        if not row:
+            return {"inbound_count": 0, "outbound_count": 0,
+                    "last_inbound": None, "last_outbound": None}
         
         return {
-            "inbound_count": inbound_count,
-            "outbound_count": outbound_count,
-            "last_inbound": last_inbound,
-            "last_outbound": last_outbound
+            "inbound_count": row["inbound_count"] or 0,
+            "outbound_count": row["outbound_count"] or 0,
+            "last_inbound": row["last_inbound_at"],
+            "last_outbound": row["last_outbound_at"]
         }
 
 
@@ -999,31 +1719,25 @@ def update_channel_email(channel_id: str, email: str) -> bool:
         return cursor.rowcount > 0
 
 
+@_ttl_cache(ttl=15)
 def get_outreach_stats() -> Dict:
     """Get outreach statistics."""
     with get_db() as conn:
         cursor = conn.cursor()
         
-        cursor.execute("SELECT COUNT(*) FROM outreach_emails")
-        total = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM outreach_emails WHERE status = 'draft'")
-        drafts = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM outreach_emails WHERE status = 'sent'")
-        sent = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM outreach_emails WHERE status = 'replied'")
-        replied = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM outreach_emails WHERE negotiation_stage = 'deal_closed'")
-        deals = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM campaigns")
-        campaigns = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM email_accounts WHERE is_active = 1")
-        active_accounts = cursor.fetchone()[0]
+        # One pass over outreach_emails for every status count
+        cursor.execute("""
+            SELECT 
+                COUNT(*),
+                COALESCE(SUM(CASE WHEN status = 'draft' THEN 1 ELSE 0 END), 0),
+                COALESCE(SUM(CASE WHEN status = 'sent' THEN 1 ELSE 0 END), 0),
+                COALESCE(SUM(CASE WHEN status = 'replied' THEN 1 ELSE 0 END), 0),
+                COALESCE(SUM(CASE WHEN negotiation_stage = 'deal_closed' THEN 1 ELSE 0 END), 0),
+                (SELECT COUNT(*) FROM campaigns),
+                (SELECT COUNT(*) FROM email_accounts WHERE is_active = 1)
+            FROM outreach_emails
+        """)
+        total, drafts, sent, replied, deals, campaigns, active_accounts = cursor.fetchone()
         
         return {
             "total_outreach": total,
@@ -1050,38 +1764,46 @@ def add_to_mailing_list(name: str, email: str, channel_id: str = None,
             VALUES (?, ?, ?, ?, ?, ?, ?)
         """, (name, email, channel_id, channel_title, subscribers, notes, campaign_id))
         conn.commit()
+        _invalidate_cache()
         return cursor.lastrowid
 
 
 def add_bulk_to_mailing_list(contacts: List[Dict], campaign_id: int = None) -> int:
     """Add multiple contacts to mailing list."""
-    added = 0
+    rows = [
+        (
+            contact.get("name", ""),
+            contact.get("email"),
+            contact.get("channel_id"),
+            contact.get("channel_title"),
+            contact.get("subscribers"),
+            contact.get("notes"),
+            campaign_id
+        )
+        for contact in contacts
+    ]
     with get_db() as conn:
         cursor = conn.cursor()
-        for contact in contacts:
-            try:
-                cursor.execute("""
-                    INSERT INTO mailing_list 
-                    (name, email, channel_id, channel_title, subscribers, notes, campaign_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    contact.get("name", ""),
-                    contact.get("email"),
-                    contact.get("channel_id"),
-                    contact.get("channel_title"),
-                    contact.get("subscribers"),
-                    contact.get("notes"),
-                    campaign_id
-                ))
-                added += 1
-            except Exception:
-                continue
+        cursor.execute("BEGIN")
+        # OR IGNORE skips rows that violate a constraint (e.g. missing email)
+        cursor.executemany("""
+            INSERT OR IGNORE INTO mailing_list 
+            (name, email, channel_id, channel_title, subscribers, notes, campaign_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+        added = cursor.rowcount
         conn.commit()
+        _invalidate_cache()
     return added
 
 
-def get_mailing_list(campaign_id: int = None, status: str = None) -> List[Dict]:
-    """Get mailing list contacts."""
+def get_mailing_list(campaign_id: int = None, status: str = None,
+                     limit: int = None, before_id: int = None) -> List[Dict]:
+    """Get mailing list contacts, newest first.
+    
+    Pass limit to page through results and the last row's id as
+    before_id to fetch the next page.
+    """
     with get_db() as conn:
         cursor = conn.cursor()
         query = "SELECT * FROM mailing_list WHERE 1=1"
@@ -1093,10 +1815,16 @@ def get_mailing_list(campaign_id: int = None, status: str = None) -> List[Dict]:
         if status:
             query += " AND status = ?"
             params.append(status)
+        if before_id:
+            query += " AND (added_at, id) < (SELECT added_at, id FROM mailing_list WHERE id = ?)"
+            params.append(before_id)
             
-        query += " ORDER BY added_at DESC"
+        query += " ORDER BY added_at DESC, id DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
         cursor.execute(query, params)
-        return [dict(row) for row in cursor.fetchall()]
+        return _fetch_dicts(cursor)
 
 
 def get_mailing_list_contact(contact_id: int) -> Optional[Dict]:
@@ -1110,12 +1838,15 @@ def get_mailing_list_contact(contact_id: int) -> Optional[Dict]:
 
 def update_mailing_list_contact(contact_id: int, **kwargs) -> bool:
     """Update a mailing list contact."""
+    if not kwargs:
+        return False
     with get_db() as conn:
         cursor = conn.cursor()
-        updates = ", ".join([f"{k} = ?" for k in kwargs.keys()])
-        values = list(kwargs.values()) + [contact_id]
-        cursor.execute(f"UPDATE mailing_list SET {updates} WHERE id = ?", values)
+        columns = tuple(sorted(kwargs))
+        values = [kwargs[column] for column in columns] + [contact_id]
+        cursor.execute(_build_update_sql('mailing_list', columns), values)
         conn.commit()
+        _invalidate_cache()
         return cursor.rowcount > 0
 
 
@@ -1125,6 +1856,7 @@ def delete_mailing_list_contact(contact_id: int) -> bool:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM mailing_list WHERE id = ?", (contact_id,))
         conn.commit()
+        _invalidate_cache()
         return cursor.rowcount > 0
 
 
@@ -1137,25 +1869,25 @@ def clear_mailing_list(campaign_id: int = None) -> int:
         else:
             cursor.execute("DELETE FROM mailing_list")
         conn.commit()
+        _invalidate_cache()
         return cursor.rowcount
 
 
+@_ttl_cache(ttl=15)
 def get_mailing_list_stats() -> Dict:
     """Get mailing list statistics."""
     with get_db() as conn:
         cursor = conn.cursor()
         
-        cursor.execute("SELECT COUNT(*) FROM mailing_list")
-        total = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM mailing_list WHERE status = 'pending'")
-        pending = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM mailing_list WHERE status = 'sent'")
-        sent = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM mailing_list WHERE status = 'replied'")
-        replied = cursor.fetchone()[0]
+        cursor.execute("""
+            SELECT 
+                COUNT(*),
+                COALESCE(SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END), 0),
+                COALESCE(SUM(CASE WHEN status = 'sent' THEN 1 ELSE 0 END), 0),
+                COALESCE(SUM(CASE WHEN status = 'replied' THEN 1 ELSE 0 END), 0)
+            FROM mailing_list
+        """)
+        total, pending, sent, replied = cursor.fetchone()
         
         return {
             "total": total,
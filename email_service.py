@@ -3,8 +3,11 @@ Email Service Module - SMTP email sending with multiple account support
 """
 import smtplib
 import ssl
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from email.message import EmailMessage
 from typing import Dict, Optional, Tuple
 import database as db
 
@@ -19,10 +22,31 @@ SMTP_CONFIGS = {
 }
 
 
+# Exact-domain lookup for the common providers
+_DOMAIN_MAP = {
+    "gmail.com": SMTP_CONFIGS["gmail"],
+    "googlemail.com": SMTP_CONFIGS["gmail"],
+    "outlook.com": SMTP_CONFIGS["outlook"],
+    "hotmail.com": SMTP_CONFIGS["outlook"],
+    "live.com": SMTP_CONFIGS["outlook"],
+    "yahoo.com": SMTP_CONFIGS["yahoo"],
+    "zoho.com": SMTP_CONFIGS["zoho"],
+}
+
+
 def get_smtp_config(email: str) -> Dict:
     """Auto-detect SMTP config based on email domain."""
-    domain = email.split("@")[-1].lower()
+    return _smtp_config_for_domain(email.split("@")[-1].lower())
+
+
+@lru_cache(maxsize=1024)
+def _smtp_config_for_domain(domain: str) -> Dict:
+    """Resolve the SMTP config for a lowercased domain (memoized)."""
+    config = _DOMAIN_MAP.get(domain)
+    if config:
+        return config
     
+    # Fall back to substring matching (e.g. regional domains like yahoo.co.uk)
     if "gmail" in domain:
         return SMTP_CONFIGS["gmail"]
     elif "outlook" in domain or "hotmail" in domain or "live" in domain:
@@ -40,13 +64,9 @@ def test_smtp_connection(email: str, smtp_host: str, smtp_port: int,
                          smtp_user: str, smtp_password: str) -> Tuple[bool, str]:
     """Test SMTP connection with given credentials."""
     try:
-        context = ssl.create_default_context()
-        with smtplib.SMTP(smtp_host, smtp_port, timeout=10) as server:
-            server.ehlo()
-            server.starttls(context=context)
-            server.ehlo()
-            server.login(smtp_user, smtp_password)
-            return True, "Connection successful"
+        server = _smtp_login(smtp_host, smtp_port, smtp_user, smtp_password, timeout=10)
+        _smtp_close(server)
+        return True, "Connection successful"
     except smtplib.SMTPAuthenticationError:
         return False, "Authentication failed. Check your email and app password."
     except smtplib.SMTPConnectError:
@@ -55,6 +75,117 @@ def test_smtp_connection(email: str, smtp_host: str, smtp_port: int,
         return False, f"Connection error: {str(e)}"
 
 
+class _TrackedSMTP(smtplib.SMTP):
+    """SMTP connection that records whether a DATA command was issued."""
+    
+    data_sent = False
+    
+    def data(self, msg):
+        self.data_sent = True
+        return super().data(msg)
+
+
+def _smtp_login(smtp_host: str, smtp_port: int, smtp_user: str,
+                smtp_password: str, timeout: int = 30) -> _TrackedSMTP:
+    """Open an authenticated STARTTLS SMTP connection."""
+    context = ssl.create_default_context()
+    server = _TrackedSMTP(smtp_host, smtp_port, timeout=timeout)
+    try:
+        server.ehlo()
+        server.starttls(context=context)
+        server.ehlo()
+        server.login(smtp_user, smtp_password)
+    except Exception:
+        _smtp_close(server)
+        raise
+    return server
+
+
+def _smtp_close(server: smtplib.SMTP):
+    """Close an SMTP connection, ignoring errors from dead sockets."""
+    try:
+        server.quit()
+    except Exception:
+        try:
+            server.close()
+        except Exception:
+            pass
+
+
+class _SMTPPool:
+    """Keeps idle authenticated SMTP connections per account for reuse."""
+    
+    # Servers typically drop idle sessions after a few minutes
+    IDLE_TIMEOUT = 120
+    # Enough for one connection per concurrent sender (see MAILING_LIST_CONCURRENCY)
+    MAX_IDLE_PER_ACCOUNT = 8
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._idle = {}  # account_id -> [(server, credentials, last_used), ...] oldest first
+    
+    @staticmethod
+    def _credentials(account: Dict) -> Tuple:
+        return (account['smtp_host'], account['smtp_port'],
+                account['smtp_user'], account['smtp_password'])
+    
+    def acquire(self, account: Dict) -> Tuple[_TrackedSMTP, bool]:
+        """Return (server, reused) - an idle live connection or a fresh one."""
+        credentials = self._credentials(account)
+        while True:
+            with self._lock:
+                idle = self._idle.get(account['id'])
+                entry = idle.pop() if idle else None
+            if not entry:
+                break
+            
+            server, idle_credentials, last_used = entry
+            if idle_credentials == credentials and time.monotonic() - last_used < self.IDLE_TIMEOUT:
+                try:
+                    if server.noop()[0] == 250:
+                        return server, True
+                except (smtplib.SMTPException, OSError):
+                    pass
+            _smtp_close(server)
+        
+        return _smtp_login(*credentials), False
+    
+    def release(self, account: Dict, server: _TrackedSMTP):
+        """Return a healthy connection to the pool."""
+        with self._lock:
+            idle = self._idle.setdefault(account['id'], [])
+            idle.append((server, self._credentials(account), time.monotonic()))
+            evicted = idle[:-self.MAX_IDLE_PER_ACCOUNT]
+            del idle[:-self.MAX_IDLE_PER_ACCOUNT]
+        for previous in evicted:
+            _smtp_close(previous[0])
+        self.reap()
+    
+    def reap(self, max_idle: float = None):
+        """Close connections idle for longer than max_idle seconds (default IDLE_TIMEOUT)."""
+        cutoff = time.monotonic() - (self.IDLE_TIMEOUT if max_idle is None else max_idle)
+        stale = []
+        with self._lock:
+            for account_id in list(self._idle):
+                idle = self._idle[account_id]
+                # Entries are oldest first, so the stale ones are a prefix
+                keep = next((i for i, entry in enumerate(idle) if entry[2] > cutoff), len(idle))
+                stale.extend(idle[:keep])
+                del idle[:keep]
+                if not idle:
+                    del self._idle[account_id]
+        for entry in stale:
+            _smtp_close(entry[0])
+
+
+_smtp_pool = _SMTPPool()
+
+
+def close_idle_smtp_connections(max_idle: float = None):
+    """Close pooled SMTP connections idle for longer than max_idle seconds (0 closes all)."""
+    _smtp_pool.reap(max_idle)
+
+
 def send_email(account_id: int, to_email: str, subject: str, 
                body: str, html_body: str = None) -> Tuple[bool, str]:
     """Send an email using a specific account."""
@@ -67,57 +198,71 @@ def send_email(account_id: int, to_email: str, subject: str,
     if not account['is_active']:
         return False, "Email account is not active"
     
-    # Check daily limit
-    if account['emails_sent_today'] >= account['daily_limit']:
+    # Take a slot under the daily limit up front; it's refunded if the send fails
+    if not db.reserve_email_send(account_id):
         return False, f"Daily limit reached ({account['daily_limit']} emails)"
     
     try:
         # Create message
-        msg = MIMEMultipart("alternative")
+        msg = EmailMessage()
         msg["Subject"] = subject
         msg["From"] = f"{account.get('display_name', '')} <{account['email']}>".strip()
         msg["To"] = to_email
         
         # Add plain text body
-        msg.attach(MIMEText(body, "plain"))
+        msg.set_content(body)
         
         # Add HTML body if provided
         if html_body:
-            msg.attach(MIMEText(html_body, "html"))
-        
-        # Connect and send
-        context = ssl.create_default_context()
-        with smtplib.SMTP(account['smtp_host'], account['smtp_port'], timeout=30) as server:
-            server.ehlo()
-            server.starttls(context=context)
-            server.ehlo()
-            server.login(account['smtp_user'], account['smtp_password'])
-            server.sendmail(account['email'], to_email, msg.as_string())
+            msg.add_alternative(html_body, subtype="html")
         
-        # Update sent counter
-        db.increment_email_sent(account_id)
+        # Send over a pooled connection, reconnecting once if it went stale
+        server, reused = _smtp_pool.acquire(account)
+        server.data_sent = False
+        try:
+            server.send_message(msg, from_addr=account['email'], to_addrs=[to_email])
+        except Exception as e:
+            _smtp_close(server)
+            # A pooled socket may have been dropped (or reset mid-TLS) while idle.
+            # Only resend if DATA was never issued - after that the server may
+            # already have accepted the message.
+            dropped = isinstance(e, smtplib.SMTPServerDisconnected) or (
+                isinstance(e, OSError) and not isinstance(e, smtplib.SMTPException))
+            if not (reused and dropped and not server.data_sent):
+                raise
+            server = _smtp_login(account['smtp_host'], account['smtp_port'],
+                                 account['smtp_user'], account['smtp_password'])
+            try:
+                server.send_message(msg, from_addr=account['email'], to_addrs=[to_email])
+            except Exception:
+                _smtp_close(server)
+                raise
+        _smtp_pool.release(account, server)
         
         return True, "Email sent successfully"
         
     except smtplib.SMTPAuthenticationError:
+        db.refund_email_send(account_id)
         return False, "Authentication failed"
     except smtplib.SMTPRecipientsRefused:
+        db.refund_email_send(account_id)
         return False, f"Recipient {to_email} refused"
     except Exception as e:
+        db.refund_email_send(account_id)
         return False, f"Send error: {str(e)}"
 
 
 def send_outreach_email(outreach_id: int) -> Tuple[bool, str]:
     """Send an outreach email."""
     
-    outreach = db.get_outreach(outreach_id)
+    # Claim the email first so it can't be sent twice
+    outreach = db.claim_outreach_for_send(outreach_id)
     if not outreach:
-        return False, "Outreach not found"
-    
-    if outreach['status'] == 'sent':
-        return False, "Email already sent"
-    
-    if not outreach['recipient_email']:
+        existing = db.get_outreach(outreach_id)
+        if not existing:
+            return False, "Outreach not found"
+        if existing['status'] == 'sent':
+            return False, "Email already sent"
         return False, "No recipient email"
     
     # Send the email
@@ -129,8 +274,6 @@ def send_outreach_email(outreach_id: int) -> Tuple[bool, str]:
     )
     
     if success:
-        # Mark as sent
-        db.mark_outreach_sent(outreach_id)
         # Add to thread
         db.add_email_thread(
             outreach_id=outreach_id,
@@ -138,6 +281,8 @@ def send_outreach_email(outreach_id: int) -> Tuple[bool, str]:
             subject=outreach['subject'],
             body=outreach['body']
         )
+    else:
+        db.release_outreach_claim(outreach_id, outreach)
     
     return success, message
 
@@ -149,6 +294,8 @@ def bulk_add_email_accounts(accounts_text: str) -> Dict:
     """
     results = {"added": 0, "failed": 0, "errors": []}
     
+    # Parse every line first: (email, smtp_host, smtp_port, smtp_user, password)
+    entries = []
     lines = accounts_text.strip().split("\n")
     for line in lines:
         line = line.strip()
@@ -182,9 +329,16 @@ def bulk_add_email_accounts(accounts_text: str) -> Dict:
             results["errors"].append(f"Invalid format: {line[:30]}...")
             continue
         
-        # Test connection first
-        success, msg = test_smtp_connection(email, smtp_host, smtp_port, smtp_user, password)
-        
+        entries.append((email, smtp_host, smtp_port, smtp_user, password))
+    
+    if not entries:
+        return results
+    
+    # Test connections in parallel - each one is mostly network wait
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        outcomes = list(executor.map(lambda entry: test_smtp_connection(*entry), entries))
+    
+    for (email, smtp_host, smtp_port, smtp_user, password), (success, msg) in zip(entries, outcomes):
         if success:
             account_id = db.add_email_account(
                 email=email,
@@ -207,8 +361,4 @@ def bulk_add_email_accounts(accounts_text: str) -> Dict:
 
 def get_available_account() -> Optional[Dict]:
     """Get an available email account that hasn't hit its daily limit."""
-    accounts = db.get_email_accounts(active_only=True)
-    for account in accounts:
-        if account['emails_sent_today'] < account['daily_limit']:
-            return account
-    return None
+    return db.get_next_available_account()
@@ -2,17 +2,33 @@
 YouTube Channel Scraper - FastAPI Application
 A beautiful web app to scrape and manage YouTube channel data.
 """
+import asyncio
+import csv
+import hashlib
+import itertools
+import logging
+import mimetypes
 import os
+import queue
+import sys
+import threading
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from contextlib import asynccontextmanager
+from functools import wraps
+from logging.handlers import QueueHandler, QueueListener
 
 from fastapi import FastAPI, Request, Query, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+import orjson
 from pydantic import BaseModel
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from dotenv import load_dotenv
 
@@ -24,31 +40,66 @@ import ai_outreach
 
 load_dotenv()
 
-# Scheduler instance
-scheduler = BackgroundScheduler()
-scraper_running = False
+# Scraper log calls only enqueue records; a listener thread does the actual writes
+_log_queue = queue.SimpleQueue()
+_log_stream = logging.StreamHandler(sys.stdout)
+_log_stream.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = QueueListener(_log_queue, _log_stream)
 
+_scraper_logger = logging.getLogger("scraper")
+_scraper_logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+_scraper_logger.addHandler(QueueHandler(_log_queue))
+_scraper_logger.propagate = False
 
-def scheduled_scrape():
+# Scheduler instance - runs on the app's event loop; blocking jobs go to threads
+scheduler = AsyncIOScheduler()
+# Held for the duration of any scrape. The scheduler already prevents overlapping
+# scheduled runs; this keeps a manual /api/scrape from running alongside one.
+_scrape_lock = threading.Lock()
+
+
+def _scrape_and_release(**kwargs) -> Dict:
+    """Run the scraper, releasing _scrape_lock when it finishes (blocking - run in a thread)."""
+    try:
+        return scraper.run_scraper(**kwargs)
+    finally:
+        _scrape_lock.release()
+
+
+async def _run_scrape_locked(**kwargs) -> Dict:
+    """
+    Run the scraper in a worker thread. The caller must hold _scrape_lock;
+    the worker releases it, so a cancelled caller can't free the lock while
+    the scrape is still running.
+    """
+    return await asyncio.shield(asyncio.to_thread(_scrape_and_release, **kwargs))
+
+
+async def scheduled_scrape():
     """Run the scraper on schedule."""
-    global scraper_running
-    if scraper_running:
+    if not _scrape_lock.acquire(blocking=False):
         print("Scraper already running, skipping...")
         return
     
-    scraper_running = True
-    try:
-        print(f"[{datetime.now()}] Starting scheduled scrape...")
-        result = scraper.run_scraper()
-        print(f"[{datetime.now()}] Scrape completed: {result['message']}")
-    finally:
-        scraper_running = False
+    print(f"[{datetime.now()}] Starting scheduled scrape...")
+    result = await _run_scrape_locked()
+    print(f"[{datetime.now()}] Scrape completed: {result['message']}")
+
+
+def _threaded_job(func):
+    """Wrap a blocking function as a coroutine job that runs in a worker thread."""
+    @wraps(func)
+    async def job():
+        return await asyncio.to_thread(func)
+    return job
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifecycle manager for the app."""
     # Startup
+    _log_listener.start()
+    
     try:
         print("Initializing database...")
         db.init_db()
@@ -64,15 +115,38 @@ async def lifespan(app: FastAPI):
             trigger=IntervalTrigger(hours=interval_hours),
             id="youtube_scraper",
             name="YouTube Channel Scraper",
+            # Never overlap runs; collapse missed runs into one
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=300,
             replace_existing=True
         )
         
         # Auto-negotiator runs every 5 minutes to check for replies
         scheduler.add_job(
-            auto_negotiator.run_auto_negotiator,
+            _threaded_job(auto_negotiator.run_auto_negotiator),
             trigger=IntervalTrigger(minutes=5),
             id="auto_negotiator",
             name="Auto Email Negotiator",
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=60,
+            replace_existing=True
+        )
+        # Persist buffered email sent counters
+        scheduler.add_job(
+            _threaded_job(db.flush_email_sent_counts),
+            trigger=IntervalTrigger(seconds=5),
+            id="email_count_flush",
+            name="Email Sent Counter Flush",
+            replace_existing=True
+        )
+        # Close pooled SMTP connections left idle after a send burst
+        scheduler.add_job(
+            _threaded_job(email_service.close_idle_smtp_connections),
+            trigger=IntervalTrigger(seconds=60),
+            id="smtp_idle_reaper",
+            name="Idle SMTP Connection Reaper",
             replace_existing=True
         )
         scheduler.start()
@@ -87,18 +161,64 @@ async def lifespan(app: FastAPI):
         scheduler.shutdown()
     except Exception as e:
         print(f"ERROR shutting down scheduler: {e}")
+    
+    try:
+        db.flush_email_sent_counts()
+    except Exception as e:
+        print(f"ERROR flushing email sent counts: {e}")
+    
+    email_service.close_idle_smtp_connections(0)
+    
+    _log_listener.stop()
 
 
 app = FastAPI(
     title="YouTube Channel Scraper",
     description="Scrape and manage YouTube channels for influencer discovery",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles with Cache-Control headers and precompressed .gz siblings."""
+    
+    # Assets aren't fingerprinted, so cache for a day rather than forever
+    CACHE_CONTROL = "public, max-age=86400"
+    
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200):
+        request_headers = Headers(scope=scope)
+        response = None
+        
+        if "gzip" in request_headers.get("accept-encoding", ""):
+            try:
+                gz_stat = os.stat(f"{full_path}.gz")
+            except OSError:
+                gz_stat = None
+            # Ignore a stale .gz left behind by an edit to the original
+            if gz_stat and gz_stat.st_mtime >= stat_result.st_mtime:
+                response = FileResponse(
+                    f"{full_path}.gz", status_code=status_code, stat_result=gz_stat,
+                    media_type=mimetypes.guess_type(str(full_path))[0] or "text/plain"
+                )
+                response.headers["Content-Encoding"] = "gzip"
+                if self.is_not_modified(response.headers, request_headers):
+                    response = NotModifiedResponse(response.headers)
+        
+        if response is None:
+            response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["Cache-Control"] = self.CACHE_CONTROL
+        # Any file may gain a .gz sibling, so caches must key every response on the encoding
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+
 # Static files and templates
-app.mount("/static", StaticFiles(directory="static"), name="static")
+app.mount("/static", CachedStaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
+# Only re-check template mtimes while developing; compiled bytecode is cached on disk
+templates.env.auto_reload = os.getenv("ENV") == "dev"
+templates.env.bytecode_cache = FileSystemBytecodeCache()
 
 
 # Pydantic models
@@ -116,6 +236,8 @@ class SearchQueryUpdate(BaseModel):
 
 
 # Routes
+# Handlers that call the blocking database/AI helpers are plain `def` so
+# FastAPI runs them in its threadpool instead of on the event loop.
 @app.get("/health")
 async def health_check():
     """Simple health check endpoint."""
@@ -129,13 +251,13 @@ async def dashboard(request: Request):
 
 
 @app.get("/api/stats")
-async def get_stats():
+def get_stats():
     """Get dashboard statistics."""
     return db.get_stats()
 
 
 @app.get("/api/channels")
-async def get_channels(
+def get_channels(
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
     search: str = Query(""),
@@ -145,8 +267,7 @@ async def get_channels(
     max_subs: int = Query(0, ge=0)
 ):
     """Get paginated channel list with filters."""
-    channels = db.get_all_channels(limit, offset, search, country, language, min_subs, max_subs)
-    total = db.get_channel_count(search, country, language, min_subs, max_subs)
+    channels, total = db.get_channels_page(limit, offset, search, country, language, min_subs, max_subs)
     return {
         "channels": channels,
         "total": total,
@@ -155,50 +276,75 @@ async def get_channels(
     }
 
 
+# ============ Filter options (static) ============
+
+# 25 major countries, priority ones (USA, India, Peru) at the top
+ALL_COUNTRIES = [
+    "US", "IN", "PE", "GB", "CA", "AU", "DE", "FR", "BR", "MX",
+    "ES", "IT", "NL", "PL", "AR", "CO", "CL", "JP", "KR", "ID",
+    "PH", "TH", "VN", "MY", "SG"
+]
+
+COUNTRY_NAMES = {
+    "US": "United States", "IN": "India", "PE": "Peru", "GB": "United Kingdom",
+    "CA": "Canada", "AU": "Australia", "DE": "Germany", "FR": "France",
+    "BR": "Brazil", "MX": "Mexico", "ES": "Spain", "IT": "Italy",
+    "NL": "Netherlands", "PL": "Poland", "AR": "Argentina", "CO": "Colombia",
+    "CL": "Chile", "JP": "Japan", "KR": "South Korea", "ID": "Indonesia",
+    "PH": "Philippines", "TH": "Thailand", "VN": "Vietnam", "MY": "Malaysia",
+    "SG": "Singapore"
+}
+
+FILTER_LANGUAGES = ["english", "hindi", "spanish", "portuguese", "french", "german",
+                    "japanese", "korean", "indonesian", "thai", "vietnamese"]
+
+SUBSCRIBER_RANGES = [
+    {"label": "All", "min": 0, "max": 0},
+    {"label": "< 1K", "min": 0, "max": 1000},
+    {"label": "1K - 10K", "min": 1000, "max": 10000},
+    {"label": "10K - 100K", "min": 10000, "max": 100000},
+    {"label": "100K - 1M", "min": 100000, "max": 1000000},
+    {"label": "> 1M", "min": 1000000, "max": 0}
+]
+
+_COUNTRIES_PAYLOAD = [{"code": c, "name": COUNTRY_NAMES.get(c, c)} for c in ALL_COUNTRIES]
+
+# The filter options never change at runtime, so the response is built once
+_FILTER_OPTIONS = {
+    "countries": _COUNTRIES_PAYLOAD,
+    "languages": FILTER_LANGUAGES,
+    "subscriber_ranges": SUBSCRIBER_RANGES
+}
+_FILTER_OPTIONS_JSON = orjson.dumps(_FILTER_OPTIONS)
+_FILTER_OPTIONS_HEADERS = {
+    "ETag": f'"{hashlib.sha256(_FILTER_OPTIONS_JSON).hexdigest()[:16]}"',
+    "Cache-Control": "public, max-age=3600"
+}
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match already names this ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
 @app.get("/api/filters")
-async def get_filter_options():
+def get_filter_options(request: Request):
     """Get available filter options."""
-    # Priority countries (USA, India, Peru at top)
-    priority_countries = ["US", "IN", "PE"]
-    
-    # Full list of 25 major countries
-    all_countries = [
-        "US", "IN", "PE", "GB", "CA", "AU", "DE", "FR", "BR", "MX",
-        "ES", "IT", "NL", "PL", "AR", "CO", "CL", "JP", "KR", "ID",
-        "PH", "TH", "VN", "MY", "SG"
-    ]
-    
-    country_names = {
-        "US": "United States", "IN": "India", "PE": "Peru", "GB": "United Kingdom",
-        "CA": "Canada", "AU": "Australia", "DE": "Germany", "FR": "France",
-        "BR": "Brazil", "MX": "Mexico", "ES": "Spain", "IT": "Italy",
-        "NL": "Netherlands", "PL": "Poland", "AR": "Argentina", "CO": "Colombia",
-        "CL": "Chile", "JP": "Japan", "KR": "South Korea", "ID": "Indonesia",
-        "PH": "Philippines", "TH": "Thailand", "VN": "Vietnam", "MY": "Malaysia",
-        "SG": "Singapore"
-    }
-    
-    languages = ["english", "hindi", "spanish", "portuguese", "french", "german", 
-                 "japanese", "korean", "indonesian", "thai", "vietnamese"]
-    
-    subscriber_ranges = [
-        {"label": "All", "min": 0, "max": 0},
-        {"label": "< 1K", "min": 0, "max": 1000},
-        {"label": "1K - 10K", "min": 1000, "max": 10000},
-        {"label": "10K - 100K", "min": 10000, "max": 100000},
-        {"label": "100K - 1M", "min": 100000, "max": 1000000},
-        {"label": "> 1M", "min": 1000000, "max": 0}
-    ]
-    
-    return {
-        "countries": [{"code": c, "name": country_names.get(c, c)} for c in all_countries],
-        "languages": languages,
-        "subscriber_ranges": subscriber_ranges
-    }
+    if _etag_matches(request, _FILTER_OPTIONS_HEADERS["ETag"]):
+        return Response(status_code=304, headers=_FILTER_OPTIONS_HEADERS)
+    return Response(
+        content=_FILTER_OPTIONS_JSON,
+        media_type="application/json",
+        headers=_FILTER_OPTIONS_HEADERS
+    )
 
 
 @app.delete("/api/channels/{channel_id}")
-async def delete_channel(channel_id: str):
+def delete_channel(channel_id: str):
     """Delete a channel."""
     if db.delete_channel(channel_id):
         return {"success": True, "message": "Channel deleted"}
@@ -206,20 +352,20 @@ async def delete_channel(channel_id: str):
 
 
 @app.get("/api/queries")
-async def get_queries():
+def get_queries():
     """Get all search queries."""
     return db.get_search_queries()
 
 
 @app.post("/api/queries")
-async def create_query(query: SearchQueryCreate):
+def create_query(query: SearchQueryCreate):
     """Create a new search query."""
     query_id = db.add_search_query(query.query, query.max_results, query.region_code)
     return {"success": True, "id": query_id}
 
 
 @app.put("/api/queries/{query_id}")
-async def update_query(query_id: int, query: SearchQueryUpdate):
+def update_query(query_id: int, query: SearchQueryUpdate):
     """Update a search query."""
     if db.update_search_query(
         query_id,
@@ -233,7 +379,7 @@ async def update_query(query_id: int, query: SearchQueryUpdate):
 
 
 @app.delete("/api/queries/{query_id}")
-async def delete_query(query_id: int):
+def delete_query(query_id: int):
     """Delete a search query."""
     if db.delete_search_query(query_id):
         return {"success": True}
@@ -241,20 +387,16 @@ async def delete_query(query_id: int):
 
 
 @app.post("/api/queries/reset")
-async def reset_queries():
+def reset_queries():
     """Reset search queries to creator-focused defaults."""
     count = db.reset_search_queries_to_creator_focused()
     return {"success": True, "message": f"Reset to {count} creator-focused queries"}
 
 
 @app.delete("/api/queries")
-async def clear_all_queries():
+def clear_all_queries():
     """Clear all search queries."""
-    with db.get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM search_queries")
-        count = cursor.rowcount
-        conn.commit()
+    count = db.clear_search_queries()
     return {"success": True, "cleared": count, "message": f"Cleared {count} queries"}
 
 
@@ -266,39 +408,30 @@ class BulkQueriesRequest(BaseModel):
 
 
 @app.post("/api/queries/bulk")
-async def add_bulk_queries(request: BulkQueriesRequest):
+def add_bulk_queries(request: BulkQueriesRequest):
     """Add multiple queries at once (newline-separated)."""
-    # Parse queries from text
-    lines = request.queries.strip().split("\n")
-    queries = [line.strip() for line in lines if line.strip()]
+    # Parse queries from text lazily; peek at the first one to detect empty input
+    queries = (line for line in map(str.strip, request.queries.splitlines()) if line)
+    first = next(queries, None)
     
-    if not queries:
+    if first is None:
         return {"success": False, "message": "No queries provided"}
     
-    # Clear existing if requested
-    if request.clear_existing:
-        with db.get_db() as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM search_queries")
-            conn.commit()
-    
-    # Add each query
-    added = 0
-    for query in queries:
-        try:
-            db.add_search_query(query, request.max_results, request.region_code)
-            added += 1
-        except Exception:
-            pass  # Skip duplicates or errors
+    # Clear (if requested) and insert everything in a single transaction
+    added = db.add_search_queries_bulk(
+        itertools.chain((first,), queries), request.max_results, request.region_code,
+        clear_existing=request.clear_existing
+    )
     
     return {"success": True, "added": added, "message": f"Added {added} queries"}
 
 
 class ScrapeRequest(BaseModel):
     clear_previous: bool = False
-    countries: list = ["US"]
-    languages: list = ["english"]
+    countries: List[str] = ["US"]
+    languages: List[str] = ["english"]
     min_subscribers: int = 0
+    refresh_cache: bool = False  # Ignore cached YouTube results
 
 
 # ============================================================
@@ -347,7 +480,7 @@ class CampaignUpdate(BaseModel):
 
 class OutreachCreate(BaseModel):
     campaign_id: int
-    channel_ids: list  # List of channel IDs
+    channel_ids: List[str]  # List of channel IDs
     email_account_id: int
 
 
@@ -374,27 +507,25 @@ class NegotiationRequest(BaseModel):
 @app.post("/api/scrape")
 async def trigger_scrape(request: ScrapeRequest = ScrapeRequest()):
     """Manually trigger a scrape with filters."""
-    global scraper_running
-    
-    if scraper_running:
-        return {"success": False, "message": "Scraper is already running"}
+    if not _scrape_lock.acquire(blocking=False):
+        return ORJSONResponse(
+            status_code=409,
+            content={"success": False, "message": "Scraper is already running"}
+        )
     
     # Run scraper with filters
-    scraper_running = True
-    try:
-        result = scraper.run_scraper(
-            clear_previous=request.clear_previous,
-            countries=request.countries,
-            languages=request.languages,
-            min_subscribers=request.min_subscribers
-        )
-        return result
-    finally:
-        scraper_running = False
+    result = await _run_scrape_locked(
+        clear_previous=request.clear_previous,
+        countries=request.countries,
+        languages=request.languages,
+        min_subscribers=request.min_subscribers,
+        refresh_cache=request.refresh_cache
+    )
+    return result
 
 
 @app.delete("/api/channels")
-async def clear_all_channels():
+def clear_all_channels():
     """Clear all channels from the database."""
     count = db.clear_all_channels()
     return {"success": True, "cleared": count, "message": f"Cleared {count} channels"}
@@ -404,38 +535,55 @@ async def clear_all_channels():
 async def scrape_status():
     """Get current scrape status."""
     return {
-        "running": scraper_running,
+        "running": _scrape_lock.locked(),
         "scheduler_running": scheduler.running,
         "next_run": str(scheduler.get_job("youtube_scraper").next_run_time) if scheduler.get_job("youtube_scraper") else None
     }
 
 
 @app.get("/api/history")
-async def get_history():
+def get_history():
     """Get scrape history."""
     return db.get_scrape_history()
 
 
+class _EchoWriter:
+    """File-like sink that hands each CSV line straight back to the caller."""
+    
+    def write(self, value):
+        return value
+
+
+def _stream_channels_csv(limit: int, batch_size: int = 500):
+    """Yield the channels table as CSV text, a batch of rows at a time."""
+    writer = csv.writer(_EchoWriter())
+    batch = []
+    for row in db.iter_channels(limit=limit, batch_size=batch_size):
+        batch.append(writer.writerow(row))
+        if len(batch) >= batch_size:
+            yield "".join(batch)
+            batch = []
+    if batch:
+        yield "".join(batch)
+
+
 @app.get("/api/export")
-async def export_channels(format: str = Query("csv")):
+def export_channels(format: str = Query("csv")):
     """Export channels as CSV."""
-    channels = db.get_all_channels(limit=10000)
+    limit = 10000
     
     if format == "csv":
-        import csv
-        import io
-        
-        output = io.StringIO()
-        if channels:
-            writer = csv.DictWriter(output, fieldnames=channels[0].keys())
-            writer.writeheader()
-            writer.writerows(channels)
-        
-        return JSONResponse(
-            content={"csv": output.getvalue(), "count": len(channels)},
-            headers={"Content-Type": "application/json"}
+        count = min(db.get_channel_count(), limit)
+        return StreamingResponse(
+            _stream_channels_csv(limit),
+            media_type="text/csv",
+            headers={
+                "Content-Disposition": "attachment; filename=channels.csv",
+                "X-Total-Count": str(count)
+            }
         )
     
+    channels = db.get_all_channels(limit=limit)
     return {"channels": channels, "count": len(channels)}
 
 
@@ -444,7 +592,7 @@ async def export_channels(format: str = Query("csv")):
 # ============================================================
 
 @app.get("/api/email-accounts")
-async def get_email_accounts():
+def get_email_accounts():
     """Get all email accounts."""
     accounts = db.get_email_accounts()
     # Remove passwords from response
@@ -454,7 +602,7 @@ async def get_email_accounts():
 
 
 @app.post("/api/email-accounts")
-async def create_email_account(account: EmailAccountCreate):
+def create_email_account(account: EmailAccountCreate):
     """Add a new email account."""
     # Auto-detect SMTP if not provided
     if not account.smtp_host:
@@ -494,12 +642,12 @@ async def create_email_account(account: EmailAccountCreate):
 @app.post("/api/email-accounts/bulk")
 async def bulk_add_email_accounts(request: EmailAccountBulkAdd):
     """Add multiple email accounts at once."""
-    results = email_service.bulk_add_email_accounts(request.accounts_text)
+    results = await asyncio.to_thread(email_service.bulk_add_email_accounts, request.accounts_text)
     return results
 
 
 @app.delete("/api/email-accounts/{account_id}")
-async def delete_email_account(account_id: int):
+def delete_email_account(account_id: int):
     """Delete an email account."""
     if db.delete_email_account(account_id):
         return {"success": True, "message": "Account deleted"}
@@ -507,7 +655,7 @@ async def delete_email_account(account_id: int):
 
 
 @app.post("/api/email-accounts/{account_id}/test")
-async def test_email_account(account_id: int):
+def test_email_account(account_id: int):
     """Test an email account connection."""
     account = db.get_email_account(account_id)
     if not account:
@@ -526,14 +674,14 @@ async def test_email_account(account_id: int):
 # ============================================================
 
 @app.get("/api/campaigns")
-async def get_campaigns(status: Optional[str] = None):
+def get_campaigns(status: Optional[str] = None):
     """Get all campaigns."""
     campaigns = db.get_campaigns(status)
     return {"campaigns": campaigns}
 
 
 @app.post("/api/campaigns")
-async def create_campaign(campaign: CampaignCreate):
+def create_campaign(campaign: CampaignCreate):
     """Create a new campaign."""
     try:
         campaign_id = db.create_campaign(
@@ -554,27 +702,29 @@ async def create_campaign(campaign: CampaignCreate):
 
 
 @app.get("/api/campaigns/{campaign_id}")
-async def get_campaign(campaign_id: int):
+def get_campaign(campaign_id: int):
     """Get a single campaign with its outreach emails."""
     campaign = db.get_campaign(campaign_id)
     if not campaign:
         raise HTTPException(status_code=404, detail="Campaign not found")
     
-    outreach = db.get_outreach_emails(campaign_id=campaign_id)
+    outreach = db.get_outreach_emails(campaign_id=campaign_id, include_body=True)
     return {"campaign": campaign, "outreach": outreach}
 
 
 @app.put("/api/campaigns/{campaign_id}")
-async def update_campaign(campaign_id: int, update: CampaignUpdate):
+def update_campaign(campaign_id: int, update: CampaignUpdate):
     """Update a campaign."""
-    update_data = {k: v for k, v in update.dict().items() if v is not None}
+    update_data = update.model_dump(exclude_unset=True, exclude_none=True)
     if db.update_campaign(campaign_id, **update_data):
+        # Templates for the old brief would otherwise stay pinned in memory
+        ai_outreach.clear_outreach_template_cache()
         return {"success": True}
     raise HTTPException(status_code=404, detail="Campaign not found")
 
 
 @app.delete("/api/campaigns/{campaign_id}")
-async def delete_campaign(campaign_id: int):
+def delete_campaign(campaign_id: int):
     """Delete a campaign."""
     if db.delete_campaign(campaign_id):
         return {"success": True}
@@ -586,20 +736,23 @@ async def delete_campaign(campaign_id: int):
 # ============================================================
 
 @app.get("/api/outreach")
-async def get_all_outreach(campaign_id: Optional[int] = None, status: Optional[str] = None):
-    """Get all outreach emails."""
-    outreach = db.get_outreach_emails(campaign_id=campaign_id, status=status)
+def get_all_outreach(campaign_id: Optional[int] = None, status: Optional[str] = None,
+                     limit: Optional[int] = Query(None, ge=1, le=1000),
+                     before_id: Optional[int] = None):
+    """Get all outreach emails (optionally one page at a time)."""
+    outreach = db.get_outreach_emails(campaign_id=campaign_id, status=status, include_body=True,
+                                      limit=limit, before_id=before_id)
     return {"outreach": outreach}
 
 
 @app.get("/api/outreach/stats")
-async def get_outreach_stats():
+def get_outreach_stats():
     """Get outreach statistics."""
     return db.get_outreach_stats()
 
 
 @app.post("/api/outreach/generate")
-async def generate_outreach_email(request: GenerateEmailRequest):
+def generate_outreach_email(request: GenerateEmailRequest):
     """Generate an AI-powered outreach email."""
     # Get campaign details
     campaign = db.get_campaign(request.campaign_id)
@@ -607,10 +760,9 @@ async def generate_outreach_email(request: GenerateEmailRequest):
         raise HTTPException(status_code=404, detail="Campaign not found")
     
     # Get channel details
-    channels = db.get_all_channels(limit=1, search=request.channel_id)
-    if not channels:
+    channel = db.get_channel_by_id(request.channel_id)
+    if not channel:
         raise HTTPException(status_code=404, detail="Channel not found")
-    channel = channels[0]
     
     # Generate email using AI
     try:
@@ -649,20 +801,19 @@ async def generate_outreach_email(request: GenerateEmailRequest):
 @app.post("/api/outreach/{outreach_id}/send")
 async def send_outreach(outreach_id: int):
     """Send an outreach email."""
-    success, message = email_service.send_outreach_email(outreach_id)
+    success, message = await asyncio.to_thread(email_service.send_outreach_email, outreach_id)
     if success:
         return {"success": True, "message": message}
     raise HTTPException(status_code=400, detail=message)
 
 
 @app.get("/api/outreach/{outreach_id}")
-async def get_outreach_detail(outreach_id: int):
+def get_outreach_detail(outreach_id: int):
     """Get outreach details with thread."""
-    outreach = db.get_outreach(outreach_id)
+    outreach, thread = db.get_outreach_with_thread(outreach_id)
     if not outreach:
         raise HTTPException(status_code=404, detail="Outreach not found")
     
-    thread = db.get_email_thread(outreach_id)
     return {"outreach": outreach, "thread": thread}
 
 
@@ -671,7 +822,7 @@ class ReplyInput(BaseModel):
 
 
 @app.post("/api/outreach/{outreach_id}/reply")
-async def log_creator_reply(outreach_id: int, request: ReplyInput):
+def log_creator_reply(outreach_id: int, request: ReplyInput):
     """Log a creator's reply (without generating AI response)."""
     outreach = db.get_outreach(outreach_id)
     if not outreach:
@@ -702,7 +853,7 @@ async def log_creator_reply(outreach_id: int, request: ReplyInput):
 
 
 @app.post("/api/outreach/{outreach_id}/negotiate")
-async def handle_negotiation(outreach_id: int, request: NegotiationRequest = None):
+def handle_negotiation(outreach_id: int, request: NegotiationRequest = None):
     """Generate AI response for a creator's reply."""
     outreach = db.get_outreach(outreach_id)
     if not outreach:
@@ -769,7 +920,7 @@ async def handle_negotiation(outreach_id: int, request: NegotiationRequest = Non
 
 
 @app.put("/api/channels/{channel_id}/email")
-async def update_channel_email(channel_id: str, update: UpdateChannelEmail):
+def update_channel_email(channel_id: str, update: UpdateChannelEmail):
     """Update email for a channel."""
     if db.update_channel_email(channel_id, update.email):
         return {"success": True}
@@ -783,7 +934,7 @@ class TestEmailRequest(BaseModel):
 
 
 @app.post("/api/test-email")
-async def send_test_email(req: TestEmailRequest):
+def send_test_email(req: TestEmailRequest):
     """Send a test email."""
     # Get the first active email account
     account = email_service.get_available_account()
@@ -817,7 +968,7 @@ async def get_auto_negotiator_status():
 
 
 @app.post("/api/auto-negotiator/run")
-async def run_auto_negotiator_now():
+def run_auto_negotiator_now():
     """Manually trigger the auto-negotiator."""
     try:
         results = auto_negotiator.run_auto_negotiator()
@@ -831,10 +982,10 @@ async def run_auto_negotiator_now():
 
 
 @app.get("/api/debug/outreach/{email}")
-async def debug_outreach_by_email(email: str):
+def debug_outreach_by_email(email: str):
     """Debug endpoint to check outreach status for a specific email."""
     # Get all outreach emails
-    all_outreach = db.get_outreach_emails()
+    all_outreach = db.get_outreach_emails(include_body=True)
     
     # Find matching ones
     matching = []
@@ -864,7 +1015,10 @@ async def debug_outreach_by_email(email: str):
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM processed_emails WHERE from_email LIKE ?", (f"%{email}%",))
         for row in cursor.fetchall():
-            processed.append(dict(row))
+            record = dict(row)
+            if isinstance(record.get('body_hash'), bytes):
+                record['body_hash'] = record['body_hash'].hex()
+            processed.append(record)
     
     return {
         "email": email,
@@ -891,21 +1045,30 @@ class MailingListBulkAdd(BaseModel):
     campaign_id: int = None
 
 
+# Max AI requests / SMTP sends in flight during one mailing list send
+MAILING_LIST_CONCURRENCY = 8
+# Contacts whose emails are generated together in one AI request (personalized sends)
+OUTREACH_BATCH_SIZE = 10
+
+
 class BulkSendRequest(BaseModel):
     campaign_id: int
     contact_ids: List[int] = None  # If None, send to all pending in campaign
+    personalize: bool = False  # Draft each email with AI instead of one campaign template
 
 
 @app.get("/api/mailing-list")
-async def get_mailing_list(campaign_id: int = None, status: str = None):
-    """Get mailing list contacts."""
-    contacts = db.get_mailing_list(campaign_id, status)
+def get_mailing_list(campaign_id: int = None, status: str = None,
+                     limit: Optional[int] = Query(None, ge=1, le=1000),
+                     before_id: Optional[int] = None):
+    """Get mailing list contacts (optionally one page at a time)."""
+    contacts = db.get_mailing_list(campaign_id, status, limit=limit, before_id=before_id)
     stats = db.get_mailing_list_stats()
     return {"contacts": contacts, "stats": stats}
 
 
 @app.post("/api/mailing-list")
-async def add_to_mailing_list(contact: MailingListContact):
+def add_to_mailing_list(contact: MailingListContact):
     """Add a contact to mailing list."""
     contact_id = db.add_to_mailing_list(
         name=contact.name,
@@ -920,7 +1083,7 @@ async def add_to_mailing_list(contact: MailingListContact):
 
 
 @app.post("/api/mailing-list/bulk")
-async def bulk_add_to_mailing_list(data: MailingListBulkAdd):
+def bulk_add_to_mailing_list(data: MailingListBulkAdd):
     """Bulk add contacts to mailing list."""
     contacts = []
     for line in data.contacts_text.strip().split("\n"):
@@ -947,7 +1110,7 @@ async def bulk_add_to_mailing_list(data: MailingListBulkAdd):
 
 
 @app.delete("/api/mailing-list/{contact_id}")
-async def delete_mailing_list_contact(contact_id: int):
+def delete_mailing_list_contact(contact_id: int):
     """Delete a contact from mailing list."""
     if db.delete_mailing_list_contact(contact_id):
         return {"success": True}
@@ -955,12 +1118,35 @@ async def delete_mailing_list_contact(contact_id: int):
 
 
 @app.delete("/api/mailing-list")
-async def clear_mailing_list(campaign_id: int = None):
+def clear_mailing_list(campaign_id: int = None):
     """Clear mailing list."""
     deleted = db.clear_mailing_list(campaign_id)
     return {"success": True, "deleted": deleted}
 
 
+def _load_mailing_list_contacts(req: BulkSendRequest) -> List[Dict]:
+    """Get the requested contacts, or every pending contact in the campaign."""
+    if req.contact_ids:
+        contacts = [db.get_mailing_list_contact(cid) for cid in req.contact_ids]
+        return [c for c in contacts if c]
+    return db.get_mailing_list(campaign_id=req.campaign_id, status="pending")
+
+
+def _send_and_record(account_id: int, contact: Dict, email_content: Dict,
+                     outreach_id: int) -> Tuple[bool, str]:
+    """Send one drafted email and record the result (blocking - run in a thread)."""
+    success, message = email_service.send_email(
+        account_id=account_id,
+        to_email=contact["email"],
+        subject=email_content["subject"],
+        body=email_content["body"]
+    )
+    if success:
+        db.mark_outreach_sent(outreach_id, account_id)
+        db.update_mailing_list_contact(contact["id"], status="sent", outreach_id=outreach_id)
+    return success, message
+
+
 @app.post("/api/mailing-list/send-all")
 async def send_to_mailing_list(req: BulkSendRequest):
     """Send emails to all contacts in mailing list."""
@@ -968,18 +1154,14 @@ async def send_to_mailing_list(req: BulkSendRequest):
         print(f"Starting campaign send for campaign_id: {req.campaign_id}")
         
         # Get campaign
-        campaign = db.get_campaign(req.campaign_id)
+        campaign = await asyncio.to_thread(db.get_campaign, req.campaign_id)
         if not campaign:
             raise HTTPException(status_code=404, detail="Campaign not found")
         
         print(f"Campaign found: {campaign.get('name')}")
         
         # Get contacts
-        if req.contact_ids:
-            contacts = [db.get_mailing_list_contact(cid) for cid in req.contact_ids]
-            contacts = [c for c in contacts if c]
-        else:
-            contacts = db.get_mailing_list(campaign_id=req.campaign_id, status="pending")
+        contacts = await asyncio.to_thread(_load_mailing_list_contacts, req)
         
         print(f"Found {len(contacts)} pending contacts")
         
@@ -987,59 +1169,97 @@ async def send_to_mailing_list(req: BulkSendRequest):
             raise HTTPException(status_code=400, detail="No pending contacts to send to")
         
         # Get available email account
-        account = email_service.get_available_account()
+        account = await asyncio.to_thread(email_service.get_available_account)
         if not account:
             raise HTTPException(status_code=400, detail="No email accounts available. Please add an email account first.")
         
         print(f"Using email account: {account.get('email')}")
         
-        sent_count = 0
-        errors = []
+        # Bound the AI calls / SMTP sends in flight to respect provider rate limits
+        semaphore = asyncio.Semaphore(MAILING_LIST_CONCURRENCY)
         
-        for contact in contacts:
-            try:
-                # Generate AI email for this contact
-                email_content = ai_outreach.generate_outreach_email(
+        campaign_details = {
+            "campaign_brief": campaign["brief"] or "",
+            "budget_min": campaign.get("budget_min") or 100,
+            "budget_max": campaign.get("budget_max") or 500,
+            "topic": campaign.get("topic") or "",
+            "requirements": campaign.get("requirements") or "",
+            "deadline": campaign.get("deadline") or "",
+            "sender_name": account.get("display_name") or "Marketing Team"
+        }
+        
+        async def _draft_batch(batch):
+            """Generate emails for a slice of contacts in one AI request."""
+            async with semaphore:
+                try:
+                    emails = await asyncio.to_thread(
+                        ai_outreach.generate_outreach_emails_batch,
+                        [
+                            {
+                                "creator_name": contact["name"],
+                                "channel_title": contact.get("channel_title") or contact["name"],
+                                "subscribers": contact.get("subscribers") or 0,
+                                "content_focus": "content creation"
+                            }
+                            for contact in batch
+                        ],
+                        **campaign_details
+                    )
+                    return [(email_content, None) for email_content in emails]
+                except Exception as e:
+                    return [(None, {"email": contact["email"], "error": str(e)}) for contact in batch]
+        
+        async def _send(contact, email_content, outreach_id):
+            """Send one drafted email; returns an error dict, or None on success."""
+            async with semaphore:
+                try:
+                    success, message = await asyncio.to_thread(
+                        _send_and_record, account["id"], contact, email_content, outreach_id
+                    )
+                    if success:
+                        return None
+                    return {"email": contact["email"], "error": message}
+                
+                except Exception as e:
+                    return {"email": contact["email"], "error": str(e)}
+        
+        if req.personalize:
+            # Generate AI emails for every contact, several contacts per request
+            batches = [contacts[i:i + OUTREACH_BATCH_SIZE] for i in range(0, len(contacts), OUTREACH_BATCH_SIZE)]
+            drafted = [
+                result
+                for batch_results in await asyncio.gather(*[_draft_batch(batch) for batch in batches])
+                for result in batch_results
+            ]
+            drafts = [(contact, email_content) for contact, (email_content, _) in zip(contacts, drafted) if email_content]
+            errors = [error for _, error in drafted if error]
+        else:
+            # Generate one AI template for the campaign, then mail-merge it per contact
+            template = await asyncio.to_thread(ai_outreach.generate_outreach_template, **campaign_details)
+            drafts = [
+                (contact, ai_outreach.render_outreach_template(
+                    template,
                     creator_name=contact["name"],
                     channel_title=contact.get("channel_title") or contact["name"],
-                    subscribers=contact.get("subscribers") or 0,
-                    content_focus="content creation",
-                    campaign_brief=campaign["brief"] or "",
-                    budget_min=campaign.get("budget_min") or 100,
-                    budget_max=campaign.get("budget_max") or 500,
-                    topic=campaign.get("topic") or "",
-                    requirements=campaign.get("requirements") or "",
-                    deadline=campaign.get("deadline") or "",
-                    sender_name=account.get("display_name") or "Marketing Team"
-                )
-                
-                # Create outreach record
-                outreach_id = db.create_outreach(
-                    campaign_id=req.campaign_id,
-                    channel_id=contact.get("channel_id"),
-                    recipient_email=contact["email"],
-                    email_account_id=account["id"],
-                    subject=email_content["subject"],
-                    body=email_content["body"]
-                )
-                
-                # Send email
-                success, message = email_service.send_email(
-                    account_id=account["id"],
-                    to_email=contact["email"],
-                    subject=email_content["subject"],
-                    body=email_content["body"]
-                )
-                
-                if success:
-                    db.mark_outreach_sent(outreach_id, account["id"])
-                    db.update_mailing_list_contact(contact["id"], status="sent", outreach_id=outreach_id)
-                    sent_count += 1
-                else:
-                    errors.append({"email": contact["email"], "error": message})
-                    
-            except Exception as e:
-                errors.append({"email": contact["email"], "error": str(e)})
+                    subscribers=contact.get("subscribers") or 0
+                ))
+                for contact in contacts
+            ]
+            errors = []
+        
+        # Create all outreach records in a single transaction
+        outreach_ids = await asyncio.to_thread(db.create_outreach_bulk, [
+            (req.campaign_id, contact.get("channel_id"), account["id"],
+             contact["email"], email_content["subject"], email_content["body"])
+            for contact, email_content in drafts
+        ])
+        
+        send_errors = await asyncio.gather(*[
+            _send(contact, email_content, outreach_id)
+            for (contact, email_content), outreach_id in zip(drafts, outreach_ids)
+        ])
+        sent_count = send_errors.count(None)
+        errors.extend(error for error in send_errors if error)
         
         print(f"Campaign send complete: {sent_count}/{len(contacts)} sent")
         return {
@@ -1059,4 +1279,4 @@ async def send_to_mailing_list(req: BulkSendRequest):
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", "8000"))
-    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True)
+    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True, loop="uvloop", http="httptools")
@@ -1,19 +1,98 @@
 """
 YouTube Channel Scraper Module
 """
+import logging
 import os
+import re
+import threading
+import time
+import orjson
 import requests
-from typing import List, Dict, Optional
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 from dotenv import load_dotenv
 
 import database as db
 
+logger = logging.getLogger("scraper")
+
 load_dotenv()
 
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY", "")
 YOUTUBE_SEARCH_URL = "https://www.googleapis.com/youtube/v3/search"
 YOUTUBE_CHANNELS_URL = "https://www.googleapis.com/youtube/v3/channels"
 
+# YouTube calls are network bound - how many to have in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+# ...and how many may start per second across all threads
+YOUTUBE_MAX_QPS = 20
+
+# Filtered channels are written to the database in batches of this size
+INSERT_BATCH_SIZE = 500
+
+
+def _create_session() -> requests.Session:
+    """Create a keep-alive session shared by all YouTube API calls."""
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _create_session()
+
+
+class _RateLimiter:
+    """Thread-safe token bucket: allows `rate` calls per second, bursting to `burst`."""
+    
+    def __init__(self, rate: float, burst: int):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a call is allowed."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+_youtube_limiter = _RateLimiter(YOUTUBE_MAX_QPS, burst=MAX_CONCURRENT_REQUESTS)
+
+
+def _youtube_get(url: str, params: Dict) -> requests.Response:
+    """GET a YouTube API endpoint on the shared session, within the QPS limit."""
+    _youtube_limiter.acquire()
+    return _SESSION.get(url, params=params, timeout=30)
+
+# Channel details change slowly; reuse them across runs to save quota.
+# channel_id -> (fetched_at, parsed channel), oldest first
+CHANNEL_CACHE_TTL = 3600
+CHANNEL_CACHE_MAX_SIZE = 50000
+_channel_cache: Dict[str, Tuple[float, Dict]] = {}
+_channel_cache_lock = threading.Lock()
+
+# Search results for a query/country rarely change within the hour either.
+# (query, max_results, region_code) -> (fetched_at, channel IDs), oldest first
+SEARCH_CACHE_TTL = 3600
+SEARCH_CACHE_MAX_SIZE = 5000
+_search_cache: Dict[Tuple[str, int, str], Tuple[float, List[str]]] = {}
+_search_cache_lock = threading.Lock()
+
 # Countries to filter - now allowing all countries (filtering done in UI)
 ALLOWED_COUNTRIES = None  # Set to None to allow all countries
 
@@ -64,27 +143,105 @@ CREATOR_INDICATORS = [
     "beginner friendly", "step by step", "complete guide",
 ]
 
+# Corporate language in a description (indicates brand)
+CORPORATE_PHRASES = [
+    "we are a", "our company", "our team", "our mission", "our vision",
+    "founded in", "established in", "leading provider", "industry leader",
+    "official channel", "official youtube", "subscribe to our",
+    "customer support", "contact us at", "visit our website",
+    "terms and conditions", "privacy policy", "all rights reserved",
+    "trusted by", "used by millions", "join millions",
+    "award-winning", "award winning", "featured in", "as seen on",
+]
+
+# Personal pronouns in a description (indicates individual)
+PERSONAL_PHRASES = [
+    "i am", "i'm", "my name is", "hey guys", "hey everyone", "what's up",
+    "welcome to my", "i help", "i teach", "i show", "i create",
+    "follow me", "join me", "let me", "i'll show", "i will show",
+    "my goal", "my mission", "i believe", "i love", "i enjoy",
+    "contact me", "email me", "dm me", "reach out to me",
+    "thanks for", "thank you for watching", "don't forget to",
+]
+
 # Strong personal name patterns (indicates individual)
 PERSONAL_NAME_PATTERNS = [
     " with ", " by ", "'s ", "ith ", # "Marketing with John", "Ads by Sarah"
 ]
 
+# First-person words near the start of a description (creator score)
+PERSONAL_WORDS = ["i ", "my ", "me ", "i'm", "i've"]
+
+# Creator score adjustments by tier, as (lowest value in tier, score delta).
+# Tiers are looked up with bisect, so lows must stay sorted.
+SUBSCRIBER_SCORE_TIERS = [
+    (float("-inf"), 0),
+    (5000, 10),      # Nano-influencers
+    (10000, 20),     # Micro-influencers - best engagement
+    (100001, 15),    # Mid-tier - good reach
+    (500001, 0),
+    (1000001, -10),  # Very large - might be brand
+]
+VIDEO_COUNT_SCORE_TIERS = [
+    (float("-inf"), -10),  # Barely active
+    (20, 0),
+    (51, 5),
+    (101, 10),
+    (201, 15),             # Video count indicates active creator
+]
+_SUBSCRIBER_TIER_LOWS = [low for low, _ in SUBSCRIBER_SCORE_TIERS]
+_VIDEO_COUNT_TIER_LOWS = [low for low, _ in VIDEO_COUNT_SCORE_TIERS]
+
+
+def _compile_any(*pattern_lists: List[str]) -> re.Pattern:
+    """Compile substring lists into one regex matching any of them."""
+    return re.compile("|".join(re.escape(p) for patterns in pattern_lists for p in patterns))
+
+
+# Compiled once so each check is a single pass over the (lowercased) text
+_HINDI_RE = _compile_any(HINDI_SIGNALS)
+_BRAND_RE = _compile_any(BRAND_INDICATORS)
+_CORPORATE_RE = _compile_any(CORPORATE_PHRASES)
+_CREATOR_SIGNALS_RE = _compile_any(CREATOR_INDICATORS, PERSONAL_PHRASES)
+_PERSONAL_NAME_RE = _compile_any(PERSONAL_NAME_PATTERNS)
+_CREATOR_RE = _compile_any(CREATOR_INDICATORS)
+_PERSONAL_WORDS_RE = _compile_any(PERSONAL_WORDS)
+
+
+def _count_present(patterns: List[str], text: str) -> int:
+    """Count how many of the given substrings occur in text."""
+    return sum(1 for pattern in patterns if pattern in text)
+
 
 def is_likely_brand_channel(channel: Dict) -> bool:
     """
     Check if a channel is likely an official brand/company channel.
     Returns True if it should be EXCLUDED.
     """
-    title = channel.get("channel_title", "").lower().strip()
-    description = channel.get("description", "").lower()
-    subs = channel.get("subscribers", 0)
-    video_count = channel.get("video_count", 0)
-    
-    # Check for brand indicators in title
-    for indicator in BRAND_INDICATORS:
-        if indicator in title:
-            return True
-    
+    return _is_brand(
+        channel.get("channel_title", "").lower(),
+        channel.get("description", "").lower(),
+        channel.get("subscribers", 0),
+        channel.get("video_count", 0)
+    )
+
+
+def is_likely_creator(channel: Dict) -> bool:
+    """
+    Check if a channel is likely an individual creator.
+    Returns True if it's a GOOD match for influencer marketing.
+    """
+    return _is_creator(
+        channel.get("channel_title", "").lower(),
+        channel.get("description", "").lower(),
+        channel.get("subscribers", 0),
+        channel.get("video_count", 0)
+    )
+
+
+def _is_brand(title: str, description: str, subs: int, video_count: int) -> bool:
+    """Brand check on an already-lowercased title and description."""
+    # Integer checks first - they settle most big channels without any text scan
     # Channels with very high subscribers (>3M) are usually brands
     if subs > 3000000:
         return True
@@ -93,19 +250,15 @@ def is_likely_brand_channel(channel: Dict) -> bool:
     if subs > 500000 and video_count < 50:
         return True
     
+    title = title.strip()
+    
+    # Check for brand indicators in title
+    if _BRAND_RE.search(title):
+        return True
+    
     # Check description for corporate language
-    corporate_phrases = [
-        "we are a", "our company", "our team", "our mission", "our vision",
-        "founded in", "established in", "leading provider", "industry leader",
-        "official channel", "official youtube", "subscribe to our",
-        "customer support", "contact us at", "visit our website",
-        "terms and conditions", "privacy policy", "all rights reserved",
-        "trusted by", "used by millions", "join millions",
-        "award-winning", "award winning", "featured in", "as seen on",
-    ]
-    for phrase in corporate_phrases:
-        if phrase in description:
-            return True
+    if _CORPORATE_RE.search(description):
+        return True
     
     # Single word channel names that are likely brands
     if len(title.split()) == 1 and subs > 100000:
@@ -115,16 +268,8 @@ def is_likely_brand_channel(channel: Dict) -> bool:
     return False
 
 
-def is_likely_creator(channel: Dict) -> bool:
-    """
-    Check if a channel is likely an individual creator.
-    Returns True if it's a GOOD match for influencer marketing.
-    """
-    title = channel.get("channel_title", "").lower()
-    description = channel.get("description", "").lower()
-    subs = channel.get("subscribers", 0)
-    video_count = channel.get("video_count", 0)
-    
+def _is_creator(title: str, description: str, subs: int, video_count: int) -> bool:
+    """Creator check on an already-lowercased title and description."""
     # Must have reasonable subscriber count for influencer marketing
     if subs < 1000:
         return False
@@ -133,34 +278,10 @@ def is_likely_creator(channel: Dict) -> bool:
     if video_count < 10:
         return False
     
-    # Strong creator signals - if found, definitely include
-    strong_signals = 0
-    
-    # Check for creator indicators in description
-    for indicator in CREATOR_INDICATORS:
-        if indicator in description:
-            strong_signals += 1
-    
-    # Personal pronouns in description suggest individual creator
-    personal_phrases = [
-        "i am", "i'm", "my name is", "hey guys", "hey everyone", "what's up",
-        "welcome to my", "i help", "i teach", "i show", "i create",
-        "follow me", "join me", "let me", "i'll show", "i will show",
-        "my goal", "my mission", "i believe", "i love", "i enjoy",
-        "contact me", "email me", "dm me", "reach out to me",
-        "thanks for", "thank you for watching", "don't forget to",
-    ]
-    for phrase in personal_phrases:
-        if phrase in description:
-            strong_signals += 1
-    
-    # Check for personal name patterns in title
-    for pattern in PERSONAL_NAME_PATTERNS:
-        if pattern in title:
-            strong_signals += 1
-    
-    # If strong signals found, include
-    if strong_signals >= 1:
+    # Strong creator signals - if any is found, definitely include:
+    # creator indicators or personal pronouns in the description,
+    # or a personal name pattern in the title
+    if _CREATOR_SIGNALS_RE.search(description) or _PERSONAL_NAME_RE.search(title):
         return True
     
     # Sweet spot range: likely individual creators
@@ -187,53 +308,60 @@ def calculate_creator_score(channel: Dict) -> int:
     subs = channel.get("subscribers", 0)
     video_count = channel.get("video_count", 0)
     
-    # Subscriber sweet spots
-    if 10000 <= subs <= 100000:
-        score += 20  # Micro-influencers - best engagement
-    elif 100000 < subs <= 500000:
-        score += 15  # Mid-tier - good reach
-    elif 5000 <= subs < 10000:
-        score += 10  # Nano-influencers
-    elif subs > 1000000:
-        score -= 10  # Very large - might be brand
-    
-    # Video count indicates active creator
-    if video_count > 200:
-        score += 15
-    elif video_count > 100:
-        score += 10
-    elif video_count > 50:
-        score += 5
-    elif video_count < 20:
-        score -= 10
-    
-    # Personal indicators
-    personal_words = ["i ", "my ", "me ", "i'm", "i've"]
-    for word in personal_words:
-        if word in description[:200]:  # Check start of description
-            score += 5
+    # Subscriber sweet spots and video count (see the *_SCORE_TIERS tables)
+    score += SUBSCRIBER_SCORE_TIERS[bisect_right(_SUBSCRIBER_TIER_LOWS, subs) - 1][1]
+    score += VIDEO_COUNT_SCORE_TIERS[bisect_right(_VIDEO_COUNT_TIER_LOWS, video_count) - 1][1]
+    
+    # Each signal scores once per distinct word; the compiled search skips
+    # the per-word count for the (usual) text that contains none of them
+    
+    # Personal indicators - only the start of the description (first 200
+    # chars), checked in place rather than on a sliced copy
+    if _PERSONAL_WORDS_RE.search(description, 0, 200):
+        score += 5 * sum(1 for word in PERSONAL_WORDS if description.find(word, 0, 200) != -1)
     
     # Creator-focused content signals
-    for indicator in CREATOR_INDICATORS:
-        if indicator in description:
-            score += 3
+    if _CREATOR_RE.search(description):
+        score += 3 * _count_present(CREATOR_INDICATORS, description)
     
     # Negative signals
-    for indicator in BRAND_INDICATORS:
-        if indicator in title:
-            score -= 20
+    if _BRAND_RE.search(title):
+        score -= 20 * _count_present(BRAND_INDICATORS, title)
     
     return max(0, min(100, score))  # Cap between 0-100
 
 
-def search_youtube_channels(query: str, max_results: int = 25, region_code: str = "US") -> List[str]:
+@lru_cache(maxsize=CHANNEL_CACHE_MAX_SIZE)
+def _classify_channel(title: str, description: str, subs: int, video_count: int) -> Tuple[bool, bool]:
+    """
+    Return (is_brand, is_creator) for a channel's classified fields.
+    Memoized so channels rejected in one scrape aren't re-scanned in the next.
+    """
+    # Lowercase once and share it between both checks
+    title = title.lower()
+    description = description.lower()
+    if _is_brand(title, description, subs, video_count):
+        return True, False
+    return False, _is_creator(title, description, subs, video_count)
+
+
+def search_youtube_channels(query: str, max_results: int = 25, region_code: str = "US",
+                            use_cache: bool = True) -> List[str]:
     """
     Search YouTube for channels matching the query.
     Returns a list of channel IDs.
+    Recent results for the same search are reused unless use_cache is False.
     """
     if not YOUTUBE_API_KEY:
         raise ValueError("YouTube API key not configured")
     
+    cache_key = (query, max_results, region_code)
+    if use_cache:
+        with _search_cache_lock:
+            entry = _search_cache.get(cache_key)
+        if entry and time.monotonic() - entry[0] < SEARCH_CACHE_TTL:
+            return list(entry[1])
+    
     params = {
         "part": "snippet",
         "q": query,
@@ -244,9 +372,9 @@ def search_youtube_channels(query: str, max_results: int = 25, region_code: str
     }
     
     try:
-        response = requests.get(YOUTUBE_SEARCH_URL, params=params, timeout=30)
+        response = _youtube_get(YOUTUBE_SEARCH_URL, params)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         channel_ids = []
         for item in data.get("items", []):
@@ -254,46 +382,96 @@ def search_youtube_channels(query: str, max_results: int = 25, region_code: str
             if channel_id:
                 channel_ids.append(channel_id)
         
-        return channel_ids
+        # Only successful searches are cached, so errors are retried next run
+        with _search_cache_lock:
+            _search_cache.pop(cache_key, None)
+            _search_cache[cache_key] = (time.monotonic(), channel_ids)
+            while len(_search_cache) > SEARCH_CACHE_MAX_SIZE:
+                del _search_cache[next(iter(_search_cache))]
+        
+        return list(channel_ids)
     
-    except requests.RequestException as e:
-        print(f"Error searching YouTube: {e}")
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
+        logger.warning("Error searching YouTube: %s", e)
         return []
 
 
-def get_channel_details(channel_ids: List[str]) -> List[Dict]:
+def _fetch_channel_batch(batch: List[str]) -> List[Dict]:
+    """Fetch and parse details for up to 50 channel IDs in one request."""
+    params = {
+        "part": "snippet,statistics",
+        "id": ",".join(batch),
+        "key": YOUTUBE_API_KEY
+    }
+    
+    channels = []
+    try:
+        response = _youtube_get(YOUTUBE_CHANNELS_URL, params)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        for item in data.get("items", []):
+            channel = parse_channel_data(item)
+            if channel:
+                channels.append(channel)
+    
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
+        logger.warning("Error getting channel details: %s", e)
+    
+    return channels
+
+
+def _get_cached_channels(channel_ids: List[str]) -> Dict[str, Dict]:
+    """Return the still-fresh cached details for the given channel IDs."""
+    now = time.monotonic()
+    with _channel_cache_lock:
+        return {
+            channel_id: entry[1]
+            for channel_id in channel_ids
+            if (entry := _channel_cache.get(channel_id)) and now - entry[0] < CHANNEL_CACHE_TTL
+        }
+
+
+def _cache_channels(channels: List[Dict]):
+    """Store freshly fetched channel details, evicting the oldest entries."""
+    now = time.monotonic()
+    with _channel_cache_lock:
+        for channel in channels:
+            # Re-insert so the dict stays ordered oldest-first
+            _channel_cache.pop(channel["channel_id"], None)
+            _channel_cache[channel["channel_id"]] = (now, channel)
+        while len(_channel_cache) > CHANNEL_CACHE_MAX_SIZE:
+            del _channel_cache[next(iter(_channel_cache))]
+
+
+def iter_channel_details(channel_ids: List[str], use_cache: bool = True) -> Iterator[Dict]:
     """
-    Get detailed information for a list of channel IDs.
+    Yield detailed information for a list of channel IDs as it arrives.
+    Cached channels come first, then each fetched batch in turn.
     """
     if not channel_ids or not YOUTUBE_API_KEY:
-        return []
+        return
     
-    # YouTube API allows up to 50 IDs per request
-    all_channels = []
+    found = _get_cached_channels(channel_ids) if use_cache else {}
+    yield from found.values()
     
-    for i in range(0, len(channel_ids), 50):
-        batch = channel_ids[i:i+50]
-        
-        params = {
-            "part": "snippet,statistics",
-            "id": ",".join(batch),
-            "key": YOUTUBE_API_KEY
-        }
-        
-        try:
-            response = requests.get(YOUTUBE_CHANNELS_URL, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            
-            for item in data.get("items", []):
-                channel = parse_channel_data(item)
-                if channel:
-                    all_channels.append(channel)
-        
-        except requests.RequestException as e:
-            print(f"Error getting channel details: {e}")
+    missing = [channel_id for channel_id in channel_ids if channel_id not in found]
     
-    return all_channels
+    # YouTube API allows up to 50 IDs per request; fetch the batches concurrently
+    batches = [missing[i:i+50] for i in range(0, len(missing), 50)]
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        for batch in executor.map(_fetch_channel_batch, batches):
+            _cache_channels(batch)
+            yield from batch
+
+
+def get_channel_details(channel_ids: List[str]) -> List[Dict]:
+    """
+    Get detailed information for a list of channel IDs.
+    Recently fetched channels are served from an in-process cache.
+    """
+    found = {channel["channel_id"]: channel for channel in iter_channel_details(channel_ids)}
+    return [found[channel_id] for channel_id in channel_ids if channel_id in found]
 
 
 def parse_channel_data(item: Dict) -> Optional[Dict]:
@@ -301,41 +479,36 @@ def parse_channel_data(item: Dict) -> Optional[Dict]:
     Parse YouTube API response into channel data.
     """
     channel_id = item.get("id")
-    snippet = item.get("snippet", {})
-    statistics = item.get("statistics", {})
-    
     if not channel_id:
         return None
     
-    title = snippet.get("title", "").lower()
-    country = (snippet.get("country", "") or "").upper()
+    # Bind the dict lookups once - this runs for every fetched channel
+    snippet_get = item.get("snippet", {}).get
+    stats_get = item.get("statistics", {}).get
+    
+    title = snippet_get("title", "")
+    country = (snippet_get("country") or "").upper()
     
     # Detect language (basic Hindi vs English detection)
     detected_language = "english"
-    if country == "IN":
+    if country == "IN" or _HINDI_RE.search(title.lower()):
         detected_language = "hindi"
-    else:
-        for signal in HINDI_SIGNALS:
-            if signal in title:
-                detected_language = "hindi"
-                break
-    
-    # Get thumbnail
-    thumbnails = snippet.get("thumbnails", {})
-    thumbnail_url = thumbnails.get("medium", {}).get("url", "")
-    if not thumbnail_url:
-        thumbnail_url = thumbnails.get("default", {}).get("url", "")
+    
+    # Get thumbnail, falling back to the default size
+    thumbnails = snippet_get("thumbnails", {})
+    thumbnail_url = ((thumbnails.get("medium") or {}).get("url")
+                     or (thumbnails.get("default") or {}).get("url", ""))
     
     return {
         "channel_id": channel_id,
         "channel_url": f"https://www.youtube.com/channel/{channel_id}",
-        "channel_title": snippet.get("title", ""),
-        "description": snippet.get("description", "")[:500],  # Limit description
+        "channel_title": title,
+        "description": snippet_get("description", "")[:500],  # Limit description
         "country": country,
         "detected_language": detected_language,
-        "subscribers": int(statistics.get("subscriberCount", 0)),
-        "total_views": int(statistics.get("viewCount", 0)),
-        "video_count": int(statistics.get("videoCount", 0)),
+        "subscribers": int(stats_get("subscriberCount") or 0),
+        "total_views": int(stats_get("viewCount") or 0),
+        "video_count": int(stats_get("videoCount") or 0),
         "thumbnail_url": thumbnail_url,
         "email": ""
     }
@@ -363,8 +536,8 @@ def filter_channels(channels: List[Dict], existing_ids: set) -> List[Dict]:
     return filtered
 
 
-def filter_channels_with_criteria(channels: List[Dict], existing_ids: set, 
-                                   languages: List[str], min_subscribers: int) -> List[Dict]:
+def iter_filtered_channels(channels: Iterable[Dict], existing_ids: set, 
+                           languages: Optional[Iterable[str]], min_subscribers: int) -> Iterator[Dict]:
     """
     Filter channels with additional criteria:
     - Remove duplicates
@@ -374,12 +547,12 @@ def filter_channels_with_criteria(channels: List[Dict], existing_ids: set,
     - EXCLUDE official brand/company channels
     - PREFER individual creators
     """
-    filtered = []
     seen_ids = set()
     excluded_brands = 0
     
     # If no languages specified, accept all
-    accept_all_languages = not languages or len(languages) == 0
+    accepted_languages = frozenset(l.lower() for l in languages or ())
+    accept_all_languages = not accepted_languages
     
     for channel in channels:
         channel_id = channel.get("channel_id")
@@ -388,11 +561,7 @@ def filter_channels_with_criteria(channels: List[Dict], existing_ids: set,
         if channel_id in existing_ids or channel_id in seen_ids:
             continue
         
-        # IMPORTANT: Skip official brand/company channels
-        if is_likely_brand_channel(channel):
-            excluded_brands += 1
-            print(f"  Excluded brand: {channel.get('channel_title')}")
-            continue
+        # Cheap field checks first, so the text scans below only run on candidates
         
         # Filter by minimum subscribers
         subs = channel.get("subscribers", 0)
@@ -401,20 +570,39 @@ def filter_channels_with_criteria(channels: List[Dict], existing_ids: set,
         
         # Filter by language
         channel_lang = channel.get("detected_language", "english").lower()
-        if not accept_all_languages and channel_lang not in [l.lower() for l in languages]:
+        if not accept_all_languages and channel_lang not in accepted_languages:
+            continue
+        
+        is_brand, is_creator = _classify_channel(
+            channel.get("channel_title", ""),
+            channel.get("description", ""),
+            subs,
+            channel.get("video_count", 0)
+        )
+        
+        # IMPORTANT: Skip official brand/company channels
+        if is_brand:
+            excluded_brands += 1
+            logger.debug("  Excluded brand: %s", channel.get('channel_title'))
             continue
         
         # Prefer individual creators
-        if is_likely_creator(channel):
+        if is_creator:
             seen_ids.add(channel_id)
-            filtered.append(channel)
+            yield channel
     
-    print(f"  Excluded {excluded_brands} brand/official channels")
-    return filtered
+    logger.info("  Excluded %d brand/official channels", excluded_brands)
+
+
+def filter_channels_with_criteria(channels: List[Dict], existing_ids: set, 
+                                   languages: Optional[Iterable[str]], min_subscribers: int) -> List[Dict]:
+    """Filter a list of channels (see iter_filtered_channels)."""
+    return list(iter_filtered_channels(channels, existing_ids, languages, min_subscribers))
 
 
 def run_scraper(clear_previous: bool = False, countries: list = None, 
-                languages: list = None, min_subscribers: int = 0) -> Dict:
+                languages: list = None, min_subscribers: int = 0,
+                refresh_cache: bool = False) -> Dict:
     """
     Run the full scraping process with filters.
     Returns a summary of the scrape.
@@ -424,6 +612,7 @@ def run_scraper(clear_previous: bool = False, countries: list = None,
         countries: List of country codes to search in (e.g., ["US", "IN", "PE"])
         languages: List of languages to filter (e.g., ["english", "hindi"])
         min_subscribers: Minimum subscriber count to include
+        refresh_cache: If True, ignores cached YouTube results and fetches fresh ones
     """
     # Default values
     if countries is None:
@@ -438,7 +627,7 @@ def run_scraper(clear_previous: bool = False, countries: list = None,
         # Clear previous channels if requested
         if clear_previous:
             cleared = db.clear_all_channels()
-            print(f"Cleared {cleared} previous channels")
+            logger.info("Cleared %d previous channels", cleared)
         
         # Get active search queries
         queries = db.get_search_queries(active_only=True)
@@ -447,56 +636,63 @@ def run_scraper(clear_previous: bool = False, countries: list = None,
             db.complete_scrape_history(history_id, 0, 0, "completed", "No active queries")
             return {"success": True, "found": 0, "added": 0, "message": "No active queries"}
         
-        # Get existing channel IDs for deduplication
-        existing_ids = db.get_existing_channel_ids()
-        
         # Search for channels across all queries AND all selected countries
-        all_channel_ids = []
-        for query_row in queries:
-            for country in countries:
-                print(f"Searching: '{query_row['query']}' in {country}")
-                channel_ids = search_youtube_channels(
-                    query_row["query"],
-                    query_row["max_results"],
-                    country  # Use the selected country instead of query's region
-                )
-                all_channel_ids.extend(channel_ids)
+        # (the selected country is used instead of each query's own region)
+        searches = [
+            (query_row["query"], query_row["max_results"], country, not refresh_cache)
+            for query_row in queries
+            for country in countries
+        ]
+        if logger.isEnabledFor(logging.DEBUG):
+            for query, _, country, _ in searches:
+                logger.debug("Searching: '%s' in %s", query, country)
         
-        # Remove duplicate IDs
-        unique_channel_ids = list(set(all_channel_ids))
-        print(f"Found {len(unique_channel_ids)} unique channel IDs")
+        # Dict keys dedupe IDs while keeping first-seen order
+        seen_channel_ids = {}
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            for channel_ids in executor.map(lambda args: search_youtube_channels(*args), searches):
+                seen_channel_ids.update(dict.fromkeys(channel_ids))
         
-        # Get channel details
-        channels = get_channel_details(unique_channel_ids)
-        
-        # Filter channels by language and minimum subscribers
-        filtered_channels = filter_channels_with_criteria(
-            channels, 
-            existing_ids, 
-            languages, 
-            min_subscribers
-        )
+        unique_channel_ids = list(seen_channel_ids)
+        logger.info("Found %d unique channel IDs", len(unique_channel_ids))
         
-        print(f"After filtering: {len(filtered_channels)} channels match criteria")
+        # Get which of those are already stored, for deduplication
+        existing_ids = db.get_existing_channel_ids(unique_channel_ids)
         
-        # Add to database
+        # Stream details through the filters, inserting in fixed-size batches
+        found_count = 0
+        filtered_count = 0
         added_count = 0
-        for channel in filtered_channels:
-            if db.add_channel(channel):
-                added_count += 1
+        pending = []
+        
+        def fetched_channels():
+            nonlocal found_count
+            for channel in iter_channel_details(unique_channel_ids, use_cache=not refresh_cache):
+                found_count += 1
+                yield channel
+        
+        for channel in iter_filtered_channels(fetched_channels(), existing_ids, languages, min_subscribers):
+            filtered_count += 1
+            pending.append(channel)
+            if len(pending) >= INSERT_BATCH_SIZE:
+                added_count += db.add_channels_bulk(pending)
+                pending = []
+        added_count += db.add_channels_bulk(pending)
+        
+        logger.info("After filtering: %d channels match criteria", filtered_count)
         
         db.complete_scrape_history(
             history_id, 
-            len(channels), 
+            found_count, 
             added_count, 
             "completed"
         )
         
         return {
             "success": True,
-            "found": len(channels),
+            "found": found_count,
             "added": added_count,
-            "message": f"Found {len(channels)} channels, added {added_count} new ones"
+            "message": f"Found {found_count} channels, added {added_count} new ones"
         }
     
     except Exception as e: